@@ -7,6 +7,8 @@ import os
 from enum import Enum
 from pathlib import Path
 
+_DEFAULT_MAX_CORES = os.cpu_count() or 1
+
 
 class RunMode(Enum):
     """Simulation run modes"""
@@ -26,14 +28,23 @@ class LogLevel(Enum):
 class Options:
     """Configuration options for Starfish simulation"""
     
+    __slots__ = ('working_directory', 'simulation_file', 'run_mode',
+                 'randomize', 'log_level', 'max_cores')
+    
+    # Default values; working_directory defaults to the current directory at creation
+    _DEFAULTS = {
+        'working_directory': None,
+        'simulation_file': None,
+        'run_mode': RunMode.GUI,
+        'randomize': True,
+        'log_level': LogLevel.INFO,
+        'max_cores': _DEFAULT_MAX_CORES,
+    }
+    
     def __init__(self, args=None):
-        # Default values
+        for name, value in Options._DEFAULTS.items():
+            setattr(self, name, value)
         self.working_directory = Path.cwd()
-        self.simulation_file = None
-        self.run_mode = RunMode.GUI
-        self.randomize = True
-        self.log_level = LogLevel.INFO
-        self.max_cores = os.cpu_count() or 1
         
         if args:
             self._parse_args(args)
@@ -46,39 +57,11 @@ class Options:
             
             if arg.startswith('-'):
                 # Handle flags
-                if arg == '-wd' and i + 1 < len(args):
-                    self.working_directory = Path(args[i + 1])
-                    i += 1
-                elif arg == '-gui':
-                    if i + 1 < len(args) and args[i + 1] in ['on', 'off', 'run']:
-                        gui_mode = args[i + 1]
-                        if gui_mode == 'off':
-                            self.run_mode = RunMode.CONSOLE
-                        elif gui_mode == 'run':
-                            self.run_mode = RunMode.GUI_RUN
-                        else:
-                            self.run_mode = RunMode.GUI
-                        i += 1
-                    else:
-                        self.run_mode = RunMode.GUI
-                elif arg == '-nr':
-                    self.randomize = False
-                elif arg == '-serial':
-                    self.max_cores = 1
-                elif arg == '-cores' and i + 1 < len(args):
-                    try:
-                        self.max_cores = int(args[i + 1])
-                    except ValueError:
-                        print(f"Invalid core count: {args[i + 1]}")
-                    i += 1
-                elif arg == '-log' and i + 1 < len(args):
-                    try:
-                        self.log_level = LogLevel(args[i + 1].lower())
-                    except ValueError:
-                        print(f"Invalid log level: {args[i + 1]}")
-                    i += 1
-                else:
-                    print(f"Unknown argument: {arg}")
+                handler = self._FLAG_HANDLERS.get(arg)
+                if handler:
+                    i = handler(self, args, i)
+                    continue
+                self._unknown_arg(arg)
             else:
                 # Assume it's a simulation file
                 if not self.simulation_file:
@@ -86,15 +69,71 @@ class Options:
             
             i += 1
     
+    # Flag handlers take the index of the flag and return the index of the next token
+    
+    def _handle_wd(self, args, i):
+        if i + 1 < len(args):
+            self.working_directory = Path(args[i + 1])
+            return i + 2
+        self._unknown_arg(args[i])
+        return i + 1
+    
+    def _handle_gui(self, args, i):
+        if i + 1 < len(args) and args[i + 1] in self._GUI_MODES:
+            self.run_mode = self._GUI_MODES[args[i + 1]]
+            return i + 2
+        self.run_mode = RunMode.GUI
+        return i + 1
+    
+    def _handle_nr(self, args, i):
+        self.randomize = False
+        return i + 1
+    
+    def _handle_serial(self, args, i):
+        self.max_cores = 1
+        return i + 1
+    
+    def _handle_cores(self, args, i):
+        if i + 1 < len(args):
+            try:
+                self.max_cores = int(args[i + 1])
+            except ValueError:
+                print(f"Invalid core count: {args[i + 1]}")
+            return i + 2
+        self._unknown_arg(args[i])
+        return i + 1
+    
+    def _handle_log(self, args, i):
+        if i + 1 < len(args):
+            try:
+                self.log_level = LogLevel(args[i + 1].lower())
+            except ValueError:
+                print(f"Invalid log level: {args[i + 1]}")
+            return i + 2
+        self._unknown_arg(args[i])
+        return i + 1
+    
+    @staticmethod
+    def _unknown_arg(arg):
+        print(f"Unknown argument: {arg}")
+    
+    _GUI_MODES = {'on': RunMode.GUI, 'off': RunMode.CONSOLE, 'run': RunMode.GUI_RUN}
+    
+    _FLAG_HANDLERS = {
+        '-wd': _handle_wd,
+        '-gui': _handle_gui,
+        '-nr': _handle_nr,
+        '-serial': _handle_serial,
+        '-cores': _handle_cores,
+        '-log': _handle_log,
+    }
+    
     def clone(self):
         """Create a copy of this options object"""
-        new_options = Options()
-        new_options.working_directory = self.working_directory
-        new_options.simulation_file = self.simulation_file
-        new_options.run_mode = self.run_mode
-        new_options.randomize = self.randomize
-        new_options.log_level = self.log_level
-        new_options.max_cores = self.max_cores
+        # Bypass __init__: every field is copied, so defaults need not be recomputed
+        new_options = Options.__new__(Options)
+        for name in Options.__slots__:
+            setattr(new_options, name, getattr(self, name))
         return new_options
     
     def __str__(self):
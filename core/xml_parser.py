@@ -3,41 +3,244 @@ XML Parser for Starfish simulation files
 Equivalent to the Java InputParser class
 """
 
-import xml.etree.ElementTree as ET
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Union, Optional, List, Dict, Any
 
+from .options import Options
+
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+
+def _local(tag: str) -> str:
+    """Strip the '{namespace}' prefix from an element tag"""
+    return tag.rpartition('}')[2] if tag[:1] == '{' else tag
+
+
+# lxml parser settings: no external entities or oversized trees, comments and
+# PIs dropped so children match stdlib ET, whitespace-only text removed so
+# element text arrives as one coalesced node, and no xml:id hash table.
+# Stdlib ET needs none of this: its TreeBuilder already joins text fragments.
+_LXML_OPTIONS = {
+    'huge_tree': False,
+    # DTD-declared values, never external files; lxml before 5.0 reads 'internal'
+    # as true and would resolve external entities too, so it resolves none there
+    'resolve_entities': 'internal' if HAS_LXML and ET.LXML_VERSION >= (5,) else False,
+    'remove_comments': True,
+    'remove_pis': True,
+    'remove_blank_text': True,
+    'collect_ids': False,
+}
+
+
+def _new_parser():
+    """Create a parser that refuses external entities and oversized trees"""
+    if HAS_LXML:
+        return ET.XMLParser(**_LXML_OPTIONS)
+    return ET.XMLParser()
+
+
+def _new_pull_parser(events):
+    """Create an event-driven parser with the same hardening as _new_parser"""
+    if HAS_LXML:
+        return ET.XMLPullParser(events=events, **_LXML_OPTIONS)
+    return ET.XMLPullParser(events=events)
+
+
+# Bytes handed to the parser per feed() call
+_FEED_CHUNK = 1 << 20
+
+
+def _is_path(tag_name: str) -> bool:
+    """True if a query is an ElementPath expression rather than a plain child tag"""
+    return tag_name[:1] == '.' or any(c in tag_name for c in '/[*@')
+
+
+# Boolean attribute spellings treated as true
+_TRUTHY_LC = frozenset(('true', '1', 'yes', 'on'))
+_TRUTHY = _TRUTHY_LC | frozenset(('True', 'TRUE', 'Yes', 'YES', 'On', 'ON'))
+
+# Interned section tags, so dict and set lookups on them compare by identity
+_TAG_TIME = sys.intern('time')
+_TAG_STARFISH = sys.intern('starfish')
+_TAG_SOLVER = sys.intern('solver')
+_TAG_DOMAIN = sys.intern('domain')
+_TAG_MATERIALS = sys.intern('materials')
+_TAG_BOUNDARIES = sys.intern('boundaries')
+_TAG_SOURCES = sys.intern('sources')
+_TAG_OUTPUT = sys.intern('output')
+_TAG_LOAD = sys.intern('load')
+
+# Top-level sections consumed by validation, parameter extraction and load lookup
+_STREAMED_TAGS = frozenset((_TAG_TIME, _TAG_STARFISH, _TAG_SOLVER, _TAG_DOMAIN, _TAG_MATERIALS,
+                            _TAG_BOUNDARIES, _TAG_SOURCES, _TAG_OUTPUT, _TAG_LOAD))
+
+
+def _parse_one(file_path: Path) -> Dict[str, Any]:
+    """Worker for parse_load_files_parallel; returns plain dicts, which pickle cleanly"""
+    return XMLParser(file_path).extract_simulation_parameters()
+
 
 class XMLParser:
     """Parser for Starfish XML simulation files"""
     
-    def __init__(self, file_path: Union[str, Path], working_directory: Union[str, Path] = None):
-        self.file_path = Path(file_path)
-        self.working_directory = Path(working_directory) if working_directory else self.file_path.parent
-        self.root = None
-        self.load_file()
+    __slots__ = ('file_path', 'working_directory', '_root', '_children_by_tag',
+                 '_sections', '_root_tag', '_element_count', '_info_flags',
+                 '_validation_cache', '_params_cache')
+    
+    def __init__(self, file_path: Union[str, Path], working_directory: Union[str, Path] = None,
+                 eager: bool = False):
+        self.file_path = file_path if isinstance(file_path, Path) else Path(file_path)
+        if not working_directory:
+            self.working_directory = self.file_path.parent
+        elif isinstance(working_directory, Path):
+            self.working_directory = working_directory
+        else:
+            self.working_directory = Path(working_directory)
+        self._root = None
+        self._children_by_tag = {}
+        self._sections = None
+        self._root_tag = None
+        self._element_count = 0
+        self._info_flags = {}
+        self._validation_cache = None
+        self._params_cache = None
+        if eager:
+            self.load_file()
+            
+    @property
+    def root(self) -> Optional[ET.Element]:
+        """Root element of the full tree, parsed on first access"""
+        if self._root is None:
+            self.load_file_full_dom()
+        return self._root
         
     def load_file(self):
-        """Load and parse the XML file"""
+        """Scan the XML file once, keeping only the sections queries consume"""
+        try:
+            self._streaming_extract()
+        except ET.ParseError as e:
+            raise ValueError(f"Failed to parse XML file {self.file_path}: {e}")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"XML file not found: {self.file_path}")
+            
+    def load_file_full_dom(self):
+        """Load the complete element tree for random access queries"""
         try:
-            tree = ET.parse(self.file_path)
-            self.root = tree.getroot()
+            parser = _new_parser()
+            for chunk in self._mapped_chunks():
+                parser.feed(chunk)
+            self._root = parser.close()
         except ET.ParseError as e:
             raise ValueError(f"Failed to parse XML file {self.file_path}: {e}")
         except FileNotFoundError:
             raise FileNotFoundError(f"XML file not found: {self.file_path}")
             
+        # Index direct children once so tag lookups are a dict hit; lxml keeps
+        # unresolved entity references as nodes whose tag is not a string
+        self._children_by_tag = {}
+        for child in self._root:
+            if isinstance(child.tag, str):
+                self._children_by_tag.setdefault(sys.intern(_local(child.tag)), []).append(child)
+        return self._root
+        
+    def _streaming_extract(self):
+        """Iterparse the file, clearing every top-level element we do not need"""
+        sections = {}
+        count = 0
+        root = None
+        depth = 0
+        for event, elem in self._iterparse(('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            count += 1
+            tag = sys.intern(_local(elem.tag))
+            if tag in _STREAMED_TAGS:
+                sections.setdefault(tag, []).append(elem)
+            else:
+                elem.clear()
+            # Detach finished siblings so the root never accumulates them
+            del root[:-1]
+            
+        self._sections = sections
+        self._root_tag = _local(root.tag) if root is not None else None
+        self._element_count = count
+        self._info_flags = {
+            'has_domain': _TAG_DOMAIN in sections,
+            'has_materials': _TAG_MATERIALS in sections,
+            'has_boundaries': _TAG_BOUNDARIES in sections,
+            'has_sources': _TAG_SOURCES in sections,
+            'has_solver': _TAG_SOLVER in sections,
+            'has_output': _TAG_OUTPUT in sections,
+        }
+        self._validation_cache = self._build_validation()
+        self._params_cache = self._build_parameters()
+        
+    def _mapped_chunks(self):
+        """Yield the file contents as slices of a read-only memory map"""
+        with open(self.file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                # mmap refuses empty files; let the parser report the missing root
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in range(0, size, _FEED_CHUNK):
+                    yield mm[offset:offset + _FEED_CHUNK]
+                    
+    def _iterparse(self, events):
+        """Feed the mapped file to a pull parser and yield its events"""
+        parser = _new_pull_parser(events)
+        for chunk in self._mapped_chunks():
+            parser.feed(chunk)
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+        
+    def _section(self, tag_name: str) -> Optional[ET.Element]:
+        """Get the first streamed top-level element with the given tag"""
+        elements = self._sections.get(tag_name)
+        return elements[0] if elements else None
+        
+    def _ensure_streamed(self):
+        """Run the streaming pass if no query has triggered it yet"""
+        if self._sections is None:
+            self.load_file()
+            
     def get_elements(self, tag_name: str) -> List[ET.Element]:
         """Get all elements with the specified tag name"""
-        if self.root is None:
-            return []
-        return self.root.findall(tag_name)
+        if _is_path(tag_name):
+            return self.root.findall(tag_name)
+        if self._root is None and tag_name in _STREAMED_TAGS:
+            self._ensure_streamed()
+            return list(self._sections.get(tag_name, []))
+        if self._root is None:
+            self.load_file_full_dom()
+        return list(self._children_by_tag.get(tag_name, []))
         
     def get_element(self, tag_name: str) -> Optional[ET.Element]:
         """Get the first element with the specified tag name"""
-        if self.root is None:
-            return None
-        return self.root.find(tag_name)
+        if _is_path(tag_name):
+            return self.root.find(tag_name)
+        if self._root is None and tag_name in _STREAMED_TAGS:
+            self._ensure_streamed()
+            return self._section(tag_name)
+        if self._root is None:
+            self.load_file_full_dom()
+        return self._children_by_tag.get(tag_name, [None])[0]
         
     @staticmethod
     def get_string(attribute_name: str, element: ET.Element, default_value: str = "") -> str:
@@ -72,7 +275,8 @@ class XMLParser:
         value = element.get(attribute_name)
         if value is None:
             return default_value
-        return value.lower() in ('true', '1', 'yes', 'on')
+        # Common spellings hit the set directly without allocating a lowered copy
+        return value in _TRUTHY or value.lower() in _TRUTHY_LC
         
     @staticmethod
     def get_text(element: ET.Element, default_value: str = "") -> str:
@@ -83,8 +287,31 @@ class XMLParser:
         """Get all child elements of a parent element"""
         return list(parent_element)
         
-    def validate_simulation_file(self) -> Dict[str, Any]:
-        """Validate the simulation file structure"""
+    def validate_simulation_file(self, collect_tags: bool = False) -> Dict[str, Any]:
+        """Validate the simulation file structure
+        
+        info['element_count'] always holds the number of top-level elements;
+        pass collect_tags=True to also get their tags in info['elements'].
+        """
+        self._ensure_streamed()
+        # A copy, so callers can add to it without changing later results
+        cache = self._validation_cache
+        validation_result = dict(cache, errors=list(cache['errors']),
+                                 warnings=list(cache['warnings']), info=dict(cache['info']))
+        if collect_tags and self._root_tag is not None:
+            validation_result['info']['elements'] = [_local(elem.tag) for elem in self]
+        return validation_result
+        
+    def extract_simulation_parameters(self) -> Dict[str, Any]:
+        """Extract key simulation parameters"""
+        self._ensure_streamed()
+        # A copy, so callers can change it without changing later results
+        params = dict(self._params_cache)
+        params['output_files'] = [dict(output_info) for output_info in params['output_files']]
+        return params
+        
+    def _build_validation(self) -> Dict[str, Any]:
+        """Build the validation report from the streamed sections"""
         validation_result = {
             'valid': True,
             'errors': [],
@@ -92,26 +319,27 @@ class XMLParser:
             'info': {}
         }
         
-        if self.root is None:
+        if self._root_tag is None:
             validation_result['valid'] = False
             validation_result['errors'].append("No root element found")
             return validation_result
             
         # Check root element
-        if self.root.tag != 'simulation':
+        root_tag = self._root_tag
+        if root_tag != 'simulation':
             validation_result['warnings'].append(
-                f"Root element is '{self.root.tag}', expected 'simulation'"
+                f"Root element is '{root_tag}', expected 'simulation'"
             )
             
         # Check for required elements
-        required_elements = ['time', 'starfish']
+        required_elements = [_TAG_TIME, _TAG_STARFISH]
         for req_elem in required_elements:
-            if self.get_element(req_elem) is None:
+            if self._section(req_elem) is None:
                 validation_result['errors'].append(f"Missing required element: {req_elem}")
                 validation_result['valid'] = False
                 
         # Check time element
-        time_elem = self.get_element('time')
+        time_elem = self._section(_TAG_TIME)
         if time_elem is not None:
             num_it = self.get_int('num_it', time_elem, -1)
             dt = self.get_double('dt', time_elem, -1.0)
@@ -122,47 +350,43 @@ class XMLParser:
                 validation_result['warnings'].append("dt not specified or invalid in time element")
                 
         # Collect information
-        validation_result['info']['elements'] = [elem.tag for elem in self.root]
-        validation_result['info']['has_domain'] = self.get_element('domain') is not None
-        validation_result['info']['has_materials'] = self.get_element('materials') is not None
-        validation_result['info']['has_boundaries'] = self.get_element('boundaries') is not None
-        validation_result['info']['has_sources'] = self.get_element('sources') is not None
-        validation_result['info']['has_solver'] = self.get_element('solver') is not None
-        validation_result['info']['has_output'] = len(self.get_elements('output')) > 0
+        validation_result['info']['element_count'] = self._element_count
+        validation_result['info'].update(self._info_flags)
         
         return validation_result
         
-    def extract_simulation_parameters(self) -> Dict[str, Any]:
-        """Extract key simulation parameters"""
+    def _build_parameters(self) -> Dict[str, Any]:
+        """Build the key simulation parameters from the streamed sections"""
         params = {}
         
         # Time parameters
-        time_elem = self.get_element('time')
+        time_elem = self._section(_TAG_TIME)
         if time_elem is not None:
             params['num_iterations'] = self.get_int('num_it', time_elem, 1000)
             params['time_step'] = self.get_double('dt', time_elem, 1e-6)
             
         # Solver parameters
-        solver_elem = self.get_element('solver')
+        solver_elem = self._section(_TAG_SOLVER)
         if solver_elem is not None:
             params['solver_type'] = self.get_string('type', solver_elem, 'poisson')
-            params['solver_method'] = self.get_text(solver_elem.find('method') or ET.Element('method'), 'gs')
+            # Explicit None check: a childless <method> element is falsy
+            method_elem = solver_elem.find('method')
+            params['solver_method'] = (method_elem.text.strip()
+                                       if method_elem is not None and method_elem.text else 'gs')
             
         # Domain information
-        domain_elem = self.get_element('domain')
-        if domain_elem is not None:
-            params['has_domain'] = True
-        else:
-            params['has_domain'] = False
+        params['has_domain'] = self._info_flags['has_domain']
             
         # Output information
-        output_elements = self.get_elements('output')
+        output_elements = self._sections.get(_TAG_OUTPUT, [])
         params['output_files'] = []
         for output_elem in output_elements:
+            # Read the attribute map once; lxml's attrib is a proxy, so materialize it
+            attrs = dict(output_elem.attrib) if HAS_LXML else output_elem.attrib
             output_info = {
-                'type': self.get_string('type', output_elem),
-                'file_name': self.get_string('file_name', output_elem),
-                'format': self.get_string('format', output_elem, 'vtk')
+                'type': attrs.get('type', ''),
+                'file_name': attrs.get('file_name', ''),
+                'format': attrs.get('format', 'vtk')
             }
             params['output_files'].append(output_info)
             
@@ -170,22 +394,35 @@ class XMLParser:
         
     def get_load_files(self) -> List[Path]:
         """Get list of files to be loaded"""
+        wd = self.working_directory
+        if self._root is not None:
+            # Whole tree already built: take each element's own text, not tails of its children
+            names = (self.get_text(load_elem) for load_elem in self._root.iterfind('load'))
+            return [wd / name for name in names if name]
+            
+        self._ensure_streamed()
         load_files = []
-        load_elements = self.get_elements('load')
-        
-        for load_elem in load_elements:
+        for load_elem in self._sections.get(_TAG_LOAD, []):
             file_name = self.get_text(load_elem)
             if file_name:
-                file_path = self.working_directory / file_name
-                load_files.append(file_path)
+                load_files.append(wd / file_name)
                 
         return load_files
         
+    def parse_load_files_parallel(self, max_workers: Optional[int] = None) -> Dict[Path, Dict[str, Any]]:
+        """Parse every load file in a process pool, returning parameters per file"""
+        load_files = self.get_load_files()
+        if len(load_files) < 2:
+            # A pool costs more to spin up than a single parse
+            return {path: _parse_one(path) for path in load_files}
+            
+        workers = min(max_workers or Options().max_cores, len(load_files))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(load_files, executor.map(_parse_one, load_files)))
+            
     def __iter__(self):
         """Iterator over root element children"""
-        if self.root is not None:
-            return iter(self.root)
-        return iter([])
+        return (child for child in self.root if isinstance(child.tag, str))
         
     def __str__(self):
         """String representation"""
@@ -0,0 +1,45 @@
+# cython: language_level=3
+"""
+Compiled versions of the XML tree walks in xml_walk.py
+
+Build in place with:  cythonize -i gui/builder/_xml_walk.pyx
+"""
+
+
+cpdef indent_xml(elem, Py_ssize_t level=0):
+    """Add pretty-printing indentation to XML"""
+    cdef list stack
+    cdef str i, child_i
+    cdef Py_ssize_t depth
+    if len(elem) and (not elem.tail or not elem.tail.strip()):
+        elem.tail = "\n" + level * "  "
+    stack = [(elem, level)]
+    while stack:
+        elem, depth = stack.pop()
+        if not len(elem):
+            continue
+        i = "\n" + depth * "  "
+        child_i = i + "  "
+        if not elem.text or not elem.text.strip():
+            elem.text = child_i
+        for child in elem:
+            if not child.tail or not child.tail.strip():
+                child.tail = child_i
+            stack.append((child, depth + 1))
+        last = elem[-1]
+        if not last.tail or not last.tail.strip():
+            last.tail = i
+
+
+cpdef list iter_tree(root):
+    """List (level, element, parent) for every element, parents before children"""
+    cdef list nodes = [(0, root, None)]
+    cdef list stack = [(root, 0)]
+    cdef Py_ssize_t level
+    while stack:
+        elem, level = stack.pop()
+        level += 1
+        for child in elem:
+            nodes.append((level, child, elem))
+            stack.append((child, level))
+    return nodes
@@ -4,17 +4,99 @@ Equivalent to the Java SimulationFileBuilder class
 """
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-                             QTreeWidget, QTreeWidgetItem, QScrollArea,
+                             QTreeView, QScrollArea,
                              QToolBar, QAction, QFileDialog, QMessageBox,
                              QFormLayout, QLineEdit, QComboBox, QSpinBox,
                              QDoubleSpinBox, QCheckBox, QTextEdit, QPushButton,
-                             QGroupBox, QLabel)
-from PyQt5.QtCore import Qt, pyqtSignal
+                             QGroupBox, QLabel, QApplication)
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QEventLoop
 from PyQt5.QtGui import QIcon
 
-import xml.etree.ElementTree as ET
+import copy
+import functools
 from pathlib import Path
 
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+from .xml_tree_model import XmlTreeModel
+from .xml_walk import indent_xml
+
+# Expand entities declared in the file's own DTD but never load external ones; lxml
+# before 5.0 reads 'internal' as true and would load them, so it expands none there
+_RESOLVE_ENTITIES = 'internal' if HAS_LXML and ET.LXML_VERSION >= (5,) else False
+
+
+# Elements parsed between event loop passes while opening a file
+_PARSE_EVENTS_INTERVAL = 1000
+
+# Default attributes for sections created with "Add Section"
+_SECTION_DEFAULTS = {
+    "domain": {"type": "rect"},
+    "mesh": {"type": "uniform"},
+    "species": {"name": "new_species"},
+    "output": {"type": "2D", "file_name": "output.vts"},
+}
+
+# Template specs: (tag, attributes, content) where content is the element
+# text, a tuple of child specs, or None
+_BASIC_PLASMA_TEMPLATE = (
+    ("note", {}, "Basic Plasma Simulation"),
+    ("log", {"level": "info"}, None),
+    # Time settings
+    ("time", {}, (
+        ("num_it", {}, "5000"),
+        ("dt", {}, "1e-6"),
+    )),
+    ("domain", {"type": "rect"}, (
+        ("x0", {}, "0.0"),
+        ("x1", {}, "0.1"),
+        ("y0", {}, "0.0"),
+        ("y1", {}, "0.1"),
+    )),
+    ("mesh", {"type": "uniform"}, (
+        ("ni", {}, "50"),
+        ("nj", {}, "50"),
+    )),
+    ("species", {"name": "O+", "type": "kinetic"}, (
+        ("mass", {}, "16"),
+        ("charge", {}, "1"),
+    )),
+    ("starfish", {}, None),
+    ("output", {"type": "2D", "file_name": "plasma.vts", "format": "vtk"}, (
+        ("scalars", {}, "phi, rho"),
+    )),
+)
+
+_ION_BEAM_TEMPLATE = _BASIC_PLASMA_TEMPLATE + (
+    ("source", {"type": "beam", "species": "O+"}, (
+        ("energy", {}, "100"),  # eV
+        ("current", {}, "1e-3"),  # A
+    )),
+)
+
+_DISCHARGE_TEMPLATE = _BASIC_PLASMA_TEMPLATE + (
+    # Electrode boundaries, values in V
+    ("boundaries", {}, (
+        ("boundary", {"name": "cathode", "type": "dirichlet", "value": "-100"}, None),
+        ("boundary", {"name": "anode", "type": "dirichlet", "value": "0"}, None),
+    )),
+)
+
+
+def _build_elements(parent, spec):
+    """Append the elements described by a template spec to parent"""
+    for tag, attrib, content in spec:
+        element = ET.SubElement(parent, tag, attrib)
+        if isinstance(content, str):
+            element.text = content
+        elif content:
+            _build_elements(element, content)
+
 
 class SimulationFileBuilder(QWidget):
     """GUI for building Starfish simulation XML files"""
@@ -23,6 +105,11 @@ class SimulationFileBuilder(QWidget):
         super().__init__()
         self.current_file = None
         self.simulation_tree = None
+        self._text_element = None  # element whose text the editor is bound to
+        self._editor_connections = []  # (signal, slot) pairs of the property panel
+        self._element_panel = None  # reused element property panel, see _ensure_element_panel
+        self._attribute_rows = []  # pooled (label, editor) rows of the element panel
+        self._dirty = False  # document modified since it was created, opened or saved
         self.init_ui()
         self.create_default_simulation()
         
@@ -38,12 +125,17 @@ class SimulationFileBuilder(QWidget):
         # Create main splitter
         splitter = QSplitter(Qt.Horizontal)
         
-        # Left side: Tree view
-        self.tree_widget = QTreeWidget()
-        self.tree_widget.setHeaderLabel("Simulation Structure")
-        self.tree_widget.setMinimumWidth(200)
-        self.tree_widget.itemClicked.connect(self.on_tree_item_clicked)
-        splitter.addWidget(self.tree_widget)
+        # Left side: Tree view over a model that reads the XML on demand
+        self.tree_model = XmlTreeModel(parent=self)
+        self.tree_view = QTreeView()
+        self.tree_view.setModel(self.tree_model)
+        self.tree_view.setMinimumWidth(200)
+        self.tree_view.clicked.connect(self.on_tree_item_clicked)
+        # Every document edit goes through the model, so its change signals track modification
+        self.tree_model.dataChanged.connect(self._mark_dirty)
+        self.tree_model.rowsInserted.connect(self._mark_dirty)
+        self.tree_model.rowsRemoved.connect(self._mark_dirty)
+        splitter.addWidget(self.tree_view)
         
         # Right side: Property editor
         self.property_scroll = QScrollArea()
@@ -54,6 +146,12 @@ class SimulationFileBuilder(QWidget):
         # Set splitter proportions
         splitter.setSizes([200, 500])
         
+        # Coalesce keystrokes in the text editor into one model update
+        self._text_commit_timer = QTimer(self)
+        self._text_commit_timer.setSingleShot(True)
+        self._text_commit_timer.setInterval(300)
+        self._text_commit_timer.timeout.connect(self._commit_pending_text)
+        
         layout.addWidget(splitter)
         
     def create_toolbar(self):
@@ -125,45 +223,38 @@ class SimulationFileBuilder(QWidget):
         self.update_tree_view()
         
     def update_tree_view(self):
-        """Update the tree widget from the XML structure"""
-        self.tree_widget.clear()
-        
-        if self.simulation_tree is not None:
-            root_item = QTreeWidgetItem(self.tree_widget)
-            root_item.setText(0, "simulation")
-            root_item.setData(0, Qt.UserRole, self.simulation_tree)
-            
-            self.add_xml_children(self.simulation_tree, root_item)
-            
-            self.tree_widget.expandAll()
-            
-    def add_xml_children(self, xml_element, tree_item):
-        """Recursively add XML children to tree"""
-        for child in xml_element:
-            child_item = QTreeWidgetItem(tree_item)
-            child_item.setText(0, child.tag)
-            child_item.setData(0, Qt.UserRole, child)
-            
-            # Add text content if present
-            if child.text and child.text.strip():
-                text_item = QTreeWidgetItem(child_item)
-                text_item.setText(0, f"Text: {child.text.strip()}")
-                text_item.setData(0, Qt.UserRole, ("text", child))
-            
-            # Add attributes
-            for attr_name, attr_value in child.attrib.items():
-                attr_item = QTreeWidgetItem(child_item)
-                attr_item.setText(0, f"{attr_name}: {attr_value}")
-                attr_item.setData(0, Qt.UserRole, ("attr", child, attr_name))
-            
-            # Recursively add children
-            self.add_xml_children(child, child_item)
+        """Point the tree view at the current XML structure"""
+        # Only needed when the document is replaced; edits go through the model
+        view = self.tree_view
+        
+        # A pending text edit belongs to the old document, and the new one starts unmodified
+        self._text_commit_timer.stop()
+        self._text_element = None
+        self._dirty = False
+        
+        # Reset and expand with repaints and signals suspended, so the
+        # view lays out and redraws once instead of once per row
+        view.setUpdatesEnabled(False)
+        view.blockSignals(True)
+        view.setSortingEnabled(False)
+        try:
+            self.tree_model.set_document(self.simulation_tree)
+            view.expandToDepth(-1)  # -1: every level, in a single layout pass
+        finally:
+            view.blockSignals(False)
+            view.setUpdatesEnabled(True)
             
-    def on_tree_item_clicked(self, item, column):
+    def _append_element(self, element, parent_element):
+        """Append a new child element and reveal its row"""
+        index = self.tree_model.append_element(parent_element, element)
+        self.tree_view.expand(index.parent())
+        self.tree_view.expand(index)
+        
+    def on_tree_item_clicked(self, index):
         """Handle tree item selection"""
-        data = item.data(0, Qt.UserRole)
+        data = index.data(Qt.UserRole)
         
-        if isinstance(data, ET.Element):
+        if ET.iselement(data):
             self.show_element_properties(data)
         elif isinstance(data, tuple) and len(data) >= 2:
             if data[0] == "text":
@@ -171,50 +262,105 @@ class SimulationFileBuilder(QWidget):
             elif data[0] == "attr":
                 self.show_attribute_properties(data[1], data[2])
                 
-    def show_element_properties(self, element):
-        """Show properties for an XML element"""
-        widget = QWidget()
-        layout = QFormLayout(widget)
+    def _connect_editor(self, signal, slot):
+        """Connect a property panel signal, remembering it for _disconnect_editors"""
+        signal.connect(slot)
+        self._editor_connections.append((signal, slot))
+        
+    def _disconnect_editors(self):
+        """Drop the previous property panel's connections before it is replaced"""
+        for signal, slot in self._editor_connections:
+            try:
+                signal.disconnect(slot)
+            except (TypeError, RuntimeError):
+                pass  # already gone with its widget
+        self._editor_connections = []
+        
+    def _on_attribute_edited(self, element, attr_name, editor):
+        """Slot for an attribute editor's editingFinished"""
+        self.update_attribute(element, attr_name, editor.text())
+        
+    def _ensure_element_panel(self):
+        """Create the element property panel once; later selections rebind it"""
+        if self._element_panel is not None:
+            return
+        panel = QWidget()
+        layout = QFormLayout(panel)
         
         # Element name (read-only)
-        name_edit = QLineEdit(element.tag)
-        name_edit.setReadOnly(True)
-        layout.addRow("Element:", name_edit)
+        self._element_name_edit = QLineEdit()
+        self._element_name_edit.setReadOnly(True)
+        layout.addRow("Element:", self._element_name_edit)
         
         # Text content
         self.text_editor = QTextEdit()
-        self.text_editor.setPlainText(element.text.strip() if element.text else "")
         self.text_editor.setMaximumHeight(100)
-        self.text_editor.textChanged.connect(lambda elem=element: self.update_text_content(elem))
         layout.addRow("Text:", self.text_editor)
         
-        # Attributes
-        self.attribute_editors = {}
-        for attr_name, attr_value in element.attrib.items():
-            attr_edit = QLineEdit(attr_value)
-            attr_edit.textChanged.connect(lambda text, elem=element, attr=attr_name: self.update_attribute(elem, attr, text))
-            self.attribute_editors[attr_name] = attr_edit
-            layout.addRow(f"{attr_name}:", attr_edit)
+        # Attribute rows are inserted here from the pool, above the buttons
         
         # Add common buttons
         button_layout = QHBoxLayout()
-
-        add_attr_btn = QPushButton("Add Attribute")
-        add_attr_btn.clicked.connect(lambda: self.add_attribute(element))
-
-        add_child_btn = QPushButton("Add Child Element")
-        add_child_btn.clicked.connect(lambda: self.add_child_element(element))
-
-        button_layout.addWidget(add_attr_btn)
-        button_layout.addWidget(add_child_btn)
+        self._add_attr_btn = QPushButton("Add Attribute")
+        self._add_child_btn = QPushButton("Add Child Element")
+        button_layout.addWidget(self._add_attr_btn)
+        button_layout.addWidget(self._add_child_btn)
         button_layout.addStretch()
-
         layout.addRow(button_layout)
         
-        self.property_scroll.setWidget(widget)
+        self._element_panel = panel
+        self._element_layout = layout
+        
+    def _set_property_panel(self, widget):
+        """Show a panel in the property area without deleting the pooled element panel"""
+        scroll = self.property_scroll
+        current = scroll.widget()
+        if current is widget:
+            return
+        if current is not None and current is self._element_panel:
+            scroll.takeWidget()  # setWidget would delete it
+        scroll.setWidget(widget)
+        
+    def show_element_properties(self, element):
+        """Show properties for an XML element"""
+        self._flush_pending_text()
+        self._disconnect_editors()
+        self._ensure_element_panel()
+        
+        self._element_name_edit.setText(element.tag)
+        self.text_editor.setPlainText(element.text.strip() if element.text else "")
+        self._text_element = element
+        self._connect_editor(self.text_editor.textChanged, self._text_commit_timer.start)
+        
+        # Attributes: rebind pooled rows, growing the pool as needed, and hide the rest
+        rows = self._attribute_rows
+        self.attribute_editors = {}
+        for i, (attr_name, attr_value) in enumerate(element.attrib.items()):
+            if i == len(rows):
+                rows.append((QLabel(), QLineEdit()))
+                self._element_layout.insertRow(2 + i, *rows[i])
+            label, attr_edit = rows[i]
+            label.setText(f"{attr_name}:")
+            attr_edit.setText(attr_value)
+            label.show()
+            attr_edit.show()
+            # Commit on Enter / focus-out rather than on every keystroke
+            self._connect_editor(attr_edit.editingFinished,
+                                 functools.partial(self._on_attribute_edited, element, attr_name, attr_edit))
+            self.attribute_editors[attr_name] = attr_edit
+        for label, attr_edit in rows[len(element.attrib):]:
+            label.hide()
+            attr_edit.hide()
+            
+        self._connect_editor(self._add_attr_btn.clicked, functools.partial(self.add_attribute, element))
+        self._connect_editor(self._add_child_btn.clicked, functools.partial(self.add_child_element, element))
+        
+        self._set_property_panel(self._element_panel)
         
     def show_text_properties(self, element):
         """Show properties for text content"""
+        self._flush_pending_text()
+        self._disconnect_editors()
         widget = QWidget()
         layout = QFormLayout(widget)
         
@@ -222,10 +368,12 @@ class SimulationFileBuilder(QWidget):
         text_edit.setPlainText(element.text.strip() if element.text else "")
         layout.addRow("Text Content:", text_edit)
         
-        self.property_scroll.setWidget(widget)
+        self._set_property_panel(widget)
         
     def show_attribute_properties(self, element, attr_name):
         """Show properties for an attribute"""
+        self._flush_pending_text()
+        self._disconnect_editors()
         widget = QWidget()
         layout = QFormLayout(widget)
         
@@ -236,7 +384,7 @@ class SimulationFileBuilder(QWidget):
         value_edit = QLineEdit(element.get(attr_name, ""))
         layout.addRow("Value:", value_edit)
         
-        self.property_scroll.setWidget(widget)
+        self._set_property_panel(widget)
         
     def new_file(self):
         """Create a new simulation file"""
@@ -256,7 +404,7 @@ class SimulationFileBuilder(QWidget):
         
         if file_path:
             try:
-                self.simulation_tree = ET.parse(file_path).getroot()
+                self.simulation_tree = self._parse_file(file_path)
                 self.current_file = Path(file_path)
                 self.update_tree_view()
             except ET.ParseError as e:
@@ -264,6 +412,21 @@ class SimulationFileBuilder(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to open file:\n{e}")
                 
+    def _parse_file(self, file_path):
+        """Parse an XML file, repainting periodically so large files don't freeze the window"""
+        if HAS_LXML:
+            # Drop comments/PIs as stdlib ET does, and blank text so pretty_print can reindent
+            context = ET.iterparse(file_path, events=('end',), remove_blank_text=True,
+                                   remove_comments=True, remove_pis=True,
+                                   resolve_entities=_RESOLVE_ENTITIES)
+        else:
+            context = ET.iterparse(file_path, events=('end',))
+        for count, _ in enumerate(context, 1):
+            if count % _PARSE_EVENTS_INTERVAL == 0:
+                # Paint and timers only: input could re-enter open/edit mid-parse
+                QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
+        return context.root
+        
     def save_file(self):
         """Save the current simulation file"""
         if self.current_file:
@@ -284,31 +447,31 @@ class SimulationFileBuilder(QWidget):
             
     def save_to_file(self, file_path):
         """Save the simulation tree to a file"""
+        self._flush_pending_text()
         try:
-            # Create pretty-printed XML
-            self.indent_xml(self.simulation_tree)
-            tree = ET.ElementTree(self.simulation_tree)
-            tree.write(str(file_path), encoding='utf-8', xml_declaration=True)
+            if HAS_LXML:
+                # libxml2 pretty-prints while serializing
+                Path(file_path).write_bytes(ET.tostring(
+                    self.simulation_tree, pretty_print=True,
+                    xml_declaration=True, encoding='utf-8'))
+            else:
+                # Indent a copy so the live tree keeps no formatting whitespace
+                root = copy.deepcopy(self.simulation_tree)
+                if hasattr(ET, 'indent'):
+                    ET.indent(root, space='  ')
+                else:
+                    self.indent_xml(root)
+                tree = ET.ElementTree(root)
+                tree.write(str(file_path), encoding='utf-8', xml_declaration=True)
             
+            self._dirty = False
             QMessageBox.information(self, "Success", f"File saved to {file_path}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save file:\n{e}")
             
     def indent_xml(self, elem, level=0):
         """Add pretty-printing indentation to XML"""
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-            for elem in elem:
-                self.indent_xml(elem, level + 1)
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = i
+        indent_xml(elem, level)
                 
     def add_section(self):
         """Add a new section to the simulation"""
@@ -326,31 +489,21 @@ class SimulationFileBuilder(QWidget):
         )
 
         if ok and section_type:
-            # Add new element to the simulation tree
-            new_element = ET.SubElement(self.simulation_tree, section_type)
-
-            # Add some default attributes based on type
-            if section_type == "domain":
-                new_element.set("type", "rect")
-            elif section_type == "mesh":
-                new_element.set("type", "uniform")
-            elif section_type == "species":
-                new_element.set("name", "new_species")
-            elif section_type == "output":
-                new_element.set("type", "2D")
-                new_element.set("file_name", "output.vts")
-
-            self.update_tree_view()
+            # Add new element to the simulation tree, with the type's default attributes
+            new_element = ET.Element(section_type, _SECTION_DEFAULTS.get(section_type, {}))
+
+            self._append_element(new_element, self.simulation_tree)
 
     def remove_section(self):
         """Remove the selected section"""
-        current_item = self.tree_widget.currentItem()
-        if not current_item:
+        self._flush_pending_text()
+        current_index = self.tree_view.currentIndex()
+        if not current_index.isValid():
             QMessageBox.information(self, "No Selection", "Please select an item to remove.")
             return
 
-        data = current_item.data(0, Qt.UserRole)
-        if isinstance(data, ET.Element):
+        data = current_index.data(Qt.UserRole)
+        if ET.iselement(data):
             # Confirm deletion
             reply = QMessageBox.question(
                 self, "Confirm Deletion",
@@ -359,14 +512,10 @@ class SimulationFileBuilder(QWidget):
             )
 
             if reply == QMessageBox.Yes:
-                # Find parent and remove element
-                parent = self.simulation_tree
-                for elem in self.simulation_tree.iter():
-                    if data in elem:
-                        elem.remove(data)
-                        break
-
-                self.update_tree_view()
+                # Look up the parent in the model's child -> parent map
+                parent = self.tree_model.parent_element(data)
+                if parent is not None:
+                    self.tree_model.remove_element(parent, data)
         else:
             QMessageBox.information(self, "Cannot Delete", "Selected item cannot be deleted.")
             
@@ -378,8 +527,13 @@ class SimulationFileBuilder(QWidget):
         if ok1 and attr_name:
             attr_value, ok2 = QInputDialog.getText(self, "Add Attribute", "Attribute value:")
             if ok2:
-                element.set(attr_name, attr_value)
-                self.update_tree_view()
+                try:
+                    # lxml rejects names/values that are not valid XML; check before touching the model
+                    ET.Element("probe").set(attr_name, attr_value)
+                except ValueError as e:
+                    QMessageBox.warning(self, "Invalid Attribute", str(e))
+                    return
+                self.tree_model.set_attribute(element, attr_name, attr_value)
                 self.show_element_properties(element)
 
     def add_child_element(self, parent_element):
@@ -388,20 +542,40 @@ class SimulationFileBuilder(QWidget):
 
         child_name, ok = QInputDialog.getText(self, "Add Child Element", "Element name:")
         if ok and child_name:
-            child = ET.SubElement(parent_element, child_name)
-            self.update_tree_view()
+            try:
+                child = ET.Element(child_name)
+            except ValueError as e:
+                QMessageBox.warning(self, "Invalid Element Name", str(e))
+                return
+            self._append_element(child, parent_element)
             self.show_element_properties(child)
 
     def update_attribute(self, element, attr_name, new_value):
         """Update an attribute value"""
-        element.set(attr_name, new_value)
-        self.update_tree_view()
+        if element.get(attr_name) != new_value:
+            self.tree_model.set_attribute(element, attr_name, new_value)
 
     def update_text_content(self, element):
         """Update text content of an element"""
         if hasattr(self, 'text_editor'):
-            element.text = self.text_editor.toPlainText()
-            self.update_tree_view()
+            text = self.text_editor.toPlainText()
+            if text != (element.text or ""):
+                self.tree_model.set_text(element, text)
+
+    def _commit_pending_text(self):
+        """Write the debounced text editor contents back to its element"""
+        if self._text_element is not None:
+            self.update_text_content(self._text_element)
+
+    def _flush_pending_text(self):
+        """Commit a pending text edit now, before the editor goes away or the file is written"""
+        if self._text_commit_timer.isActive():
+            self._text_commit_timer.stop()
+            self._commit_pending_text()
+        # A focused attribute editor has not emitted editingFinished yet (e.g. on Ctrl+S)
+        for attr_edit in getattr(self, 'attribute_editors', {}).values():
+            if attr_edit.hasFocus():
+                attr_edit.editingFinished.emit()
 
     def load_template(self):
         """Load a simulation template"""
@@ -423,107 +597,40 @@ class SimulationFileBuilder(QWidget):
             if self.check_unsaved_changes():
                 templates[template_name]()
 
-    def create_basic_plasma_template(self):
-        """Create a basic plasma simulation template"""
+    def _create_template(self, spec):
+        """Replace the document with one built from a template spec"""
         self.simulation_tree = ET.Element("simulation")
-
-        # Basic structure
-        note = ET.SubElement(self.simulation_tree, "note")
-        note.text = "Basic Plasma Simulation"
-
-        log = ET.SubElement(self.simulation_tree, "log")
-        log.set("level", "info")
-
-        # Time settings
-        time = ET.SubElement(self.simulation_tree, "time")
-        num_it = ET.SubElement(time, "num_it")
-        num_it.text = "5000"
-        dt = ET.SubElement(time, "dt")
-        dt.text = "1e-6"
-
-        # Domain
-        domain = ET.SubElement(self.simulation_tree, "domain")
-        domain.set("type", "rect")
-        x0 = ET.SubElement(domain, "x0")
-        x0.text = "0.0"
-        x1 = ET.SubElement(domain, "x1")
-        x1.text = "0.1"
-        y0 = ET.SubElement(domain, "y0")
-        y0.text = "0.0"
-        y1 = ET.SubElement(domain, "y1")
-        y1.text = "0.1"
-
-        # Mesh
-        mesh = ET.SubElement(self.simulation_tree, "mesh")
-        mesh.set("type", "uniform")
-        ni = ET.SubElement(mesh, "ni")
-        ni.text = "50"
-        nj = ET.SubElement(mesh, "nj")
-        nj.text = "50"
-
-        # Species
-        species = ET.SubElement(self.simulation_tree, "species")
-        species.set("name", "O+")
-        species.set("type", "kinetic")
-        mass = ET.SubElement(species, "mass")
-        mass.text = "16"
-        charge = ET.SubElement(species, "charge")
-        charge.text = "1"
-
-        # Starfish
-        ET.SubElement(self.simulation_tree, "starfish")
-
-        # Output
-        output = ET.SubElement(self.simulation_tree, "output")
-        output.set("type", "2D")
-        output.set("file_name", "plasma.vts")
-        output.set("format", "vtk")
-        scalars = ET.SubElement(output, "scalars")
-        scalars.text = "phi, rho"
-
+        _build_elements(self.simulation_tree, spec)
         self.update_tree_view()
 
+    def create_basic_plasma_template(self):
+        """Create a basic plasma simulation template"""
+        self._create_template(_BASIC_PLASMA_TEMPLATE)
+
     def create_ion_beam_template(self):
         """Create an ion beam simulation template"""
-        self.create_basic_plasma_template()
-
-        # Add ion beam source
-        source = ET.SubElement(self.simulation_tree, "source")
-        source.set("type", "beam")
-        source.set("species", "O+")
-
-        # Beam parameters
-        energy = ET.SubElement(source, "energy")
-        energy.text = "100"  # eV
-
-        current = ET.SubElement(source, "current")
-        current.text = "1e-3"  # A
-
-        self.update_tree_view()
+        self._create_template(_ION_BEAM_TEMPLATE)
 
     def create_discharge_template(self):
         """Create a discharge simulation template"""
-        self.create_basic_plasma_template()
-
-        # Add electrode boundaries
-        boundaries = ET.SubElement(self.simulation_tree, "boundaries")
+        self._create_template(_DISCHARGE_TEMPLATE)
 
-        # Cathode
-        cathode = ET.SubElement(boundaries, "boundary")
-        cathode.set("name", "cathode")
-        cathode.set("type", "dirichlet")
-        cathode.set("value", "-100")  # V
-
-        # Anode
-        anode = ET.SubElement(boundaries, "boundary")
-        anode.set("name", "anode")
-        anode.set("type", "dirichlet")
-        anode.set("value", "0")  # V
-
-        self.update_tree_view()
+    def _mark_dirty(self, *args):
+        """Slot for model edits: the document now differs from the saved file"""
+        self._dirty = True
 
     def check_unsaved_changes(self):
-        """Check if there are unsaved changes"""
-        # For now, always return True
-        # In a full implementation, this would track modifications
-        return True
+        """Offer to save a modified document; returns False if the caller should stop"""
+        self._flush_pending_text()
+        if not self._dirty:
+            return True
+        reply = QMessageBox.question(
+            self, "Unsaved Changes",
+            "The simulation file has been modified. Do you want to save your changes?",
+            QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel,
+            QMessageBox.Save
+        )
+        if reply == QMessageBox.Save:
+            self.save_file()
+            return not self._dirty  # still dirty if the save failed or was cancelled
+        return reply == QMessageBox.Discard
@@ -0,0 +1,233 @@
+"""
+Item model exposing an XML element tree to a QTreeView
+"""
+
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex
+
+from .xml_walk import iter_tree
+
+
+class XmlTreeModel(QAbstractItemModel):
+    """Read-through model over an ElementTree document
+
+    Each element row is followed by an optional "Text:" row and one row per
+    attribute, then its child elements. Rows are produced on demand from the
+    element itself, so no per-node item objects are allocated up front.
+    """
+
+    def __init__(self, root=None, parent=None):
+        super().__init__(parent)
+        self._root = root
+        self._parents = {}  # id(element) -> parent element
+        self._elements = {}  # id(element) -> element, keeps indexed nodes alive
+        self._leaves = {}  # id(element) -> {key: ("text", element) / ("attr", element, name)}
+        self._children = {}  # id(element) -> list of child elements
+        self._child_rows = {}  # id(element) -> {id(child): position among children}
+        if root is not None:
+            self._register_subtree(root)
+
+    def set_document(self, root):
+        """Replace the whole document"""
+        self.beginResetModel()
+        self._root = root
+        self._parents = {}
+        self._elements = {}
+        self._leaves = {}
+        self._children = {}
+        self._child_rows = {}
+        if root is not None:
+            self._register_subtree(root)
+        self.endResetModel()
+        
+    def parent_element(self, element):
+        """Parent of an element in the document, or None for the root"""
+        return self._parents.get(id(element))
+
+    # Row layout helpers
+
+    @staticmethod
+    def _text_rows(element):
+        return 1 if element.text and element.text.strip() else 0
+
+    def _leaf(self, element, kind, attr_name=None):
+        # Leaf rows point at cached tuples, since an index does not own its pointer
+        leaves = self._leaves.setdefault(id(element), {})
+        key = (kind, attr_name)
+        node = leaves.get(key)
+        if node is None:
+            node = (kind, element) if attr_name is None else (kind, element, attr_name)
+            leaves[key] = node
+        return node
+
+    def _children_of(self, element):
+        # lxml's len() and [] walk the sibling list, so keep children as a Python list
+        children = self._children.get(id(element))
+        if children is None:
+            children = self._children[id(element)] = list(element)
+        return children
+
+    def _child_row(self, parent, child):
+        rows = self._child_rows.get(id(parent))
+        if rows is None:
+            rows = {id(c): i for i, c in enumerate(self._children_of(parent))}
+            self._child_rows[id(parent)] = rows
+        return rows[id(child)]
+
+    def index_for_element(self, element):
+        """Model index of an element row"""
+        if element is self._root:
+            return self.createIndex(0, 0, element)
+        parent = self._parents.get(id(element))
+        if parent is None:
+            return QModelIndex()
+        row = self._text_rows(parent) + len(parent.attrib) + self._child_row(parent, element)
+        return self.createIndex(row, 0, element)
+
+    def _register_subtree(self, element):
+        # Walked once per document or appended subtree, so parent() is a dict lookup
+        parents, elements = self._parents, self._elements
+        for _, child, parent in iter_tree(element):
+            elements[id(child)] = child
+            if parent is not None:
+                parents[id(child)] = parent
+
+    # QAbstractItemModel interface
+
+    def index(self, row, column, parent=QModelIndex()):
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row == 0 and self._root is not None:
+                return self.createIndex(0, 0, self._root)
+            return QModelIndex()
+
+        element = parent.internalPointer()
+        if isinstance(element, tuple):
+            return QModelIndex()
+        text_rows = self._text_rows(element)
+        if row < text_rows:
+            return self.createIndex(row, 0, self._leaf(element, "text"))
+        row -= text_rows
+        if row < len(element.attrib):
+            attr_name = list(element.attrib)[row]
+            return self.createIndex(row + text_rows, 0,
+                                    self._leaf(element, "attr", attr_name))
+        row -= len(element.attrib)
+        children = self._children_of(element)
+        if row < len(children):
+            child = children[row]
+            return self.createIndex(row + text_rows + len(element.attrib), 0, child)
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        if isinstance(node, tuple):
+            return self.index_for_element(node[1])
+        if node is self._root:
+            return QModelIndex()
+        return self.index_for_element(self._parents[id(node)])
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return 0 if self._root is None else 1
+        node = parent.internalPointer()
+        if isinstance(node, tuple):
+            return 0
+        return self._text_rows(node) + len(node.attrib) + len(self._children_of(node))
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.UserRole:
+            return node
+        if role != Qt.DisplayRole:
+            return None
+        if not isinstance(node, tuple):
+            return "simulation" if node is self._root else node.tag
+        if node[0] == "text":
+            return f"Text: {node[1].text.strip()}"
+        return f"{node[2]}: {node[1].get(node[2], '')}"
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and section == 0:
+            return "Simulation Structure"
+        return None
+
+    # Editing: mutate the document and notify attached views
+
+    def set_attribute(self, element, attr_name, value):
+        """Set an attribute, repainting or inserting just its row"""
+        parent_index = self.index_for_element(element)
+        if attr_name in element.attrib:
+            element.set(attr_name, value)
+            row = self._text_rows(element) + list(element.attrib).index(attr_name)
+            changed = self.index(row, 0, parent_index)
+            self.dataChanged.emit(changed, changed)
+            return
+        row = self._text_rows(element) + len(element.attrib)
+        self.beginInsertRows(parent_index, row, row)
+        element.set(attr_name, value)
+        self.endInsertRows()
+
+    def set_text(self, element, text):
+        """Set element text, adding, repainting or dropping its "Text:" row"""
+        had_row = self._text_rows(element)
+        has_row = 1 if text and text.strip() else 0
+        if not has_row:
+            # Blank text is stored as none, or lxml treats the children as mixed
+            # content and writes them unindented on one line
+            text = None
+        parent_index = self.index_for_element(element)
+        if had_row and not has_row:
+            self.beginRemoveRows(parent_index, 0, 0)
+            element.text = text
+            self.endRemoveRows()
+        elif has_row and not had_row:
+            self.beginInsertRows(parent_index, 0, 0)
+            element.text = text
+            self.endInsertRows()
+        else:
+            element.text = text
+            if has_row:
+                changed = self.index(0, 0, parent_index)
+                self.dataChanged.emit(changed, changed)
+
+    def append_element(self, parent, child):
+        """Append a child element and insert its row"""
+        parent_index = self.index_for_element(parent)
+        row = self.rowCount(parent_index)
+        self.beginInsertRows(parent_index, row, row)
+        parent.append(child)
+        self._parents[id(child)] = parent
+        children = self._children.get(id(parent))
+        if children is not None:
+            children.append(child)
+            rows = self._child_rows.get(id(parent))
+            if rows is not None:
+                rows[id(child)] = len(children) - 1
+        self._register_subtree(child)
+        self.endInsertRows()
+        return self.index_for_element(child)
+
+    def remove_element(self, parent, child):
+        """Remove a child element and its row"""
+        parent_index = self.index_for_element(parent)
+        row = self._text_rows(parent) + len(parent.attrib) + self._child_row(parent, child)
+        self.beginRemoveRows(parent_index, row, row)
+        parent.remove(child)
+        # Later siblings shift up, so the parent's child caches are rebuilt on demand
+        self._children.pop(id(parent), None)
+        self._child_rows.pop(id(parent), None)
+        self.endRemoveRows()
+        for elem in child.iter():
+            self._parents.pop(id(elem), None)
+            self._elements.pop(id(elem), None)
+            self._leaves.pop(id(elem), None)
+            self._children.pop(id(elem), None)
+            self._child_rows.pop(id(elem), None)
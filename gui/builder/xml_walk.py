@@ -0,0 +1,53 @@
+"""
+XML tree walks used by the simulation file builder
+
+These are the pure Python implementations. If the Cython version in
+_xml_walk.pyx has been compiled (cythonize -i gui/builder/_xml_walk.pyx),
+its functions replace them at import time.
+"""
+
+
+def indent_xml(elem, level=0):
+    """Add pretty-printing indentation to XML"""
+    # Explicit stack instead of recursion: no frame per node, no depth limit.
+    # Each element indents its own text and its children's tails.
+    if len(elem) and (not elem.tail or not elem.tail.strip()):
+        elem.tail = "\n" + level * "  "
+    stack = [(elem, level)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        elem, level = pop()
+        if not len(elem):
+            continue
+        i = "\n" + level * "  "
+        child_i = i + "  "
+        if not elem.text or not elem.text.strip():
+            elem.text = child_i
+        for child in elem:
+            if not child.tail or not child.tail.strip():
+                child.tail = child_i
+            push((child, level + 1))
+        # The last child's tail closes the parent, so it gets the parent's indent
+        last = elem[-1]
+        if not last.tail or not last.tail.strip():
+            last.tail = i
+
+
+def iter_tree(root):
+    """List (level, element, parent) for every element, parents before children"""
+    nodes = [(0, root, None)]
+    stack = [(root, 0)]
+    pop, push, add = stack.pop, stack.append, nodes.append
+    while stack:
+        elem, level = pop()
+        level += 1
+        for child in elem:
+            add((level, child, elem))
+            push((child, level))
+    return nodes
+
+
+try:
+    from ._xml_walk import indent_xml, iter_tree
+except ImportError:
+    pass
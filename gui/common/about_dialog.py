@@ -5,12 +5,43 @@ About dialog for Starfish GUI
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QTextEdit, QDialogButtonBox)
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap, QFont
+from PyQt5.QtGui import QPixmap, QFont, QTextDocument
 
 
 class AboutDialog(QDialog):
     """About dialog showing application information"""
     
+    # Built on first open and shared by later instances, so the rich text is
+    # parsed once. The dialog is modal, so only one view uses the document.
+    _TITLE_FONT = None
+    _DESCRIPTION_DOC = None
+    _DESCRIPTION_HTML = """
+        <h3>2D Plasma/Fluid Simulation Software</h3>
+        <p><b>Starfish</b> is a 2D (Cartesian or axisymmetric) code for simulating 
+        a wide range of plasma and gas problems. It implements the electrostatic 
+        Particle-in-Cell (ES-PIC) method along with several fluid solvers.</p>
+        
+        <p><b>Features:</b></p>
+        <ul>
+        <li>Electrostatic Particle-in-Cell (ES-PIC) method</li>
+        <li>Multiple fluid solvers</li>
+        <li>Material interactions through MCC or DSMC collisions</li>
+        <li>Chemical reactions support</li>
+        <li>Multi-domain rectilinear or body-fitted meshes</li>
+        <li>Linear/cubic spline surface geometry</li>
+        <li>Plugin architecture for extensibility</li>
+        </ul>
+        
+        <p><b>Copyright:</b> © 2012-2019, Particle In Cell Consulting LLC</p>
+        <p><b>License:</b> Simplified BSD (Modified for Non-Commercial Use)</p>
+        <p><b>Website:</b> <a href="https://www.particleincell.com/starfish">
+        https://www.particleincell.com/starfish</a></p>
+        
+        <hr>
+        <p><i>This Python GUI implementation maintains full compatibility with 
+        the original Java version while eliminating VTK compilation issues.</i></p>
+        """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.init_ui()
@@ -25,10 +56,12 @@ class AboutDialog(QDialog):
         
         # Title
         title_label = QLabel("Starfish")
-        title_font = QFont()
-        title_font.setPointSize(24)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        if AboutDialog._TITLE_FONT is None:
+            title_font = QFont()
+            title_font.setPointSize(24)
+            title_font.setBold(True)
+            AboutDialog._TITLE_FONT = title_font
+        title_label.setFont(AboutDialog._TITLE_FONT)
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
@@ -40,32 +73,10 @@ class AboutDialog(QDialog):
         # Description
         description = QTextEdit()
         description.setReadOnly(True)
-        description.setHtml("""
-        <h3>2D Plasma/Fluid Simulation Software</h3>
-        <p><b>Starfish</b> is a 2D (Cartesian or axisymmetric) code for simulating 
-        a wide range of plasma and gas problems. It implements the electrostatic 
-        Particle-in-Cell (ES-PIC) method along with several fluid solvers.</p>
-        
-        <p><b>Features:</b></p>
-        <ul>
-        <li>Electrostatic Particle-in-Cell (ES-PIC) method</li>
-        <li>Multiple fluid solvers</li>
-        <li>Material interactions through MCC or DSMC collisions</li>
-        <li>Chemical reactions support</li>
-        <li>Multi-domain rectilinear or body-fitted meshes</li>
-        <li>Linear/cubic spline surface geometry</li>
-        <li>Plugin architecture for extensibility</li>
-        </ul>
-        
-        <p><b>Copyright:</b> © 2012-2019, Particle In Cell Consulting LLC</p>
-        <p><b>License:</b> Simplified BSD (Modified for Non-Commercial Use)</p>
-        <p><b>Website:</b> <a href="https://www.particleincell.com/starfish">
-        https://www.particleincell.com/starfish</a></p>
-        
-        <hr>
-        <p><i>This Python GUI implementation maintains full compatibility with 
-        the original Java version while eliminating VTK compilation issues.</i></p>
-        """)
+        if AboutDialog._DESCRIPTION_DOC is None:
+            AboutDialog._DESCRIPTION_DOC = QTextDocument()
+            AboutDialog._DESCRIPTION_DOC.setHtml(self._DESCRIPTION_HTML)
+        description.setDocument(AboutDialog._DESCRIPTION_DOC)
         layout.addWidget(description)
         
         # Button box
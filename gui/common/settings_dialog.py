@@ -15,6 +15,11 @@ from core.options import LogLevel
 class SettingsDialog(QDialog):
     """Settings configuration dialog"""
     
+    # Enum order is fixed, so the combo box rows map to levels by position
+    _LOG_LEVELS = tuple(LogLevel)
+    _LOG_LEVEL_INDEX = {level: i for i, level in enumerate(_LOG_LEVELS)}
+    _LOG_LEVEL_LABELS = [level.value.title() for level in _LOG_LEVELS]
+    
     def __init__(self, options, parent=None):
         super().__init__(parent)
         self.options = options.clone()  # Work with a copy
@@ -34,11 +39,17 @@ class SettingsDialog(QDialog):
         # Create tab widget
         self.tab_widget = QTabWidget()
         
-        # Create tabs
-        self.create_general_tab()
-        self.create_builder_tab()
-        self.create_runner_tab()
-        self.create_viewer_tab()
+        # Create tab placeholders; contents are built the first time a tab is shown
+        self._tab_builders = {}
+        tabs = (("General", self.create_general_tab),
+                ("Builder", self.create_builder_tab),
+                ("Runner", self.create_runner_tab),
+                ("Viewer", self.create_viewer_tab))
+        for index, (title, builder) in enumerate(tabs):
+            self.tab_widget.addTab(QWidget(), title)
+            self._tab_builders[index] = builder
+        self._ensure_tab_built(0)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         
         layout.addWidget(self.tab_widget)
         
@@ -52,9 +63,14 @@ class SettingsDialog(QDialog):
         
         layout.addWidget(button_box)
         
-    def create_general_tab(self):
+    def _ensure_tab_built(self, index):
+        """Build a tab's contents on first use"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            builder(self.tab_widget.widget(index))
+            
+    def create_general_tab(self, tab):
         """Create general settings tab"""
-        tab = QWidget()
         layout = QFormLayout(tab)
         
         # Working directory
@@ -76,18 +92,15 @@ class SettingsDialog(QDialog):
         
         # Log level
         self.log_level_combo = QComboBox()
-        self.log_level_combo.addItems([level.value.title() for level in LogLevel])
+        self.log_level_combo.addItems(self._LOG_LEVEL_LABELS)
         layout.addRow("Log Level:", self.log_level_combo)
         
         # Randomize
         self.randomize_check = QCheckBox("Enable randomization")
         layout.addRow(self.randomize_check)
         
-        self.tab_widget.addTab(tab, "General")
-        
-    def create_builder_tab(self):
+    def create_builder_tab(self, tab):
         """Create simulation builder settings tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Builder-specific settings would go here
@@ -108,11 +121,8 @@ class SettingsDialog(QDialog):
         layout.addWidget(group)
         layout.addStretch()
         
-        self.tab_widget.addTab(tab, "Builder")
-        
-    def create_runner_tab(self):
+    def create_runner_tab(self, tab):
         """Create simulation runner settings tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Runner-specific settings
@@ -124,20 +134,19 @@ class SettingsDialog(QDialog):
         self.autosave_spin.setMinimum(0)
         self.autosave_spin.setMaximum(3600)
         self.autosave_spin.setSuffix(" seconds")
+        self.autosave_spin.setValue(60)
         group_layout.addRow("Auto-save Interval:", self.autosave_spin)
         
         # Show progress in title
         self.progress_title_check = QCheckBox("Show progress in window title")
+        self.progress_title_check.setChecked(True)
         group_layout.addRow(self.progress_title_check)
         
         layout.addWidget(group)
         layout.addStretch()
         
-        self.tab_widget.addTab(tab, "Runner")
-        
-    def create_viewer_tab(self):
+    def create_viewer_tab(self, tab):
         """Create result viewer settings tab"""
-        tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Viewer-specific settings
@@ -147,16 +156,22 @@ class SettingsDialog(QDialog):
         # Default colormap
         self.colormap_combo = QComboBox()
         self.colormap_combo.addItems(['viridis', 'plasma', 'inferno', 'magma', 'jet', 'rainbow'])
+        self.colormap_combo.setCurrentText('viridis')
         group_layout.addRow("Default Colormap:", self.colormap_combo)
         
         # Auto-refresh
         self.auto_refresh_check = QCheckBox("Auto-refresh during simulation")
+        self.auto_refresh_check.setChecked(True)
         group_layout.addRow(self.auto_refresh_check)
         
         layout.addWidget(group)
         layout.addStretch()
         
-        self.tab_widget.addTab(tab, "Viewer")
+    def refresh(self, options):
+        """Reload the dialog from options before it is shown again"""
+        self.options = options.clone()
+        self.original_options = options
+        self.load_settings()
         
     def load_settings(self):
         """Load current settings into the dialog"""
@@ -164,18 +179,11 @@ class SettingsDialog(QDialog):
         self.max_cores_spin.setValue(self.options.max_cores)
         
         # Set log level
-        log_level_index = list(LogLevel).index(self.options.log_level)
+        log_level_index = self._LOG_LEVEL_INDEX[self.options.log_level]
         self.log_level_combo.setCurrentIndex(log_level_index)
         
         self.randomize_check.setChecked(self.options.randomize)
         
-        # Set default values for other settings
-        self.template_dir_edit.setText("")
-        self.autosave_spin.setValue(60)
-        self.progress_title_check.setChecked(True)
-        self.colormap_combo.setCurrentText('viridis')
-        self.auto_refresh_check.setChecked(True)
-        
     def browse_working_directory(self):
         """Browse for working directory"""
         directory = QFileDialog.getExistingDirectory(
@@ -207,14 +215,24 @@ class SettingsDialog(QDialog):
         """Save settings from dialog to options"""
         from pathlib import Path
         
-        # Update options
-        self.options.working_directory = Path(self.working_dir_edit.text())
-        self.options.max_cores = self.max_cores_spin.value()
-        self.options.log_level = list(LogLevel)[self.log_level_combo.currentIndex()]
-        self.options.randomize = self.randomize_check.isChecked()
-        
-        # Copy back to original options
-        self.original_options.working_directory = self.options.working_directory
-        self.original_options.max_cores = self.options.max_cores
-        self.original_options.log_level = self.options.log_level
-        self.original_options.randomize = self.options.randomize
+        # Update options, copying back to the original only what changed,
+        # so Apply without edits is a no-op
+        options = self.options
+        original = self.original_options
+        
+        working_dir = self.working_dir_edit.text()
+        if str(options.working_directory) != working_dir:
+            options.working_directory = Path(working_dir)
+            original.working_directory = options.working_directory
+            
+        max_cores = self.max_cores_spin.value()
+        if options.max_cores != max_cores:
+            options.max_cores = original.max_cores = max_cores
+            
+        log_level = self._LOG_LEVELS[self.log_level_combo.currentIndex()]
+        if options.log_level is not log_level:
+            options.log_level = original.log_level = log_level
+            
+        randomize = self.randomize_check.isChecked()
+        if options.randomize != randomize:
+            options.randomize = original.randomize = randomize
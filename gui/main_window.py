@@ -23,6 +23,7 @@ class StarfishMainWindow(QMainWindow):
         super().__init__()
         self.options = options
         self.settings_dialog = None
+        self._connected = False
         
         self.init_ui()
         self.setup_connections()
@@ -47,15 +48,16 @@ class StarfishMainWindow(QMainWindow):
         # Create main content area
         self.content_stack = QStackedWidget()
         
-        # Create the three main panels
-        self.simulation_builder = SimulationFileBuilder()
-        self.simulation_runner = SimulationRunner(self.options)
-        self.result_viewer = SimulationResultViewer(self.simulation_runner)
-        
-        # Add panels to stack
-        self.content_stack.addWidget(self.simulation_builder)
-        self.content_stack.addWidget(self.simulation_runner)
-        self.content_stack.addWidget(self.result_viewer)
+        # The three main panels are created on first visit; until then the
+        # stack holds an empty placeholder at each panel's index
+        self._panels = [None, None, None]
+        self._panel_factories = [
+            SimulationFileBuilder,
+            lambda: SimulationRunner(self.options),
+            lambda: SimulationResultViewer(self.simulation_runner),
+        ]
+        for _ in self._panels:
+            self.content_stack.addWidget(QWidget())
         
         # Add to main layout
         main_layout.addWidget(self.side_panel)
@@ -64,6 +66,36 @@ class StarfishMainWindow(QMainWindow):
         # Show simulation builder by default
         self.show_simulation_builder()
         
+    def _get_panel(self, index):
+        """Return a main panel, creating it in place of its placeholder on first use"""
+        panel = self._panels[index]
+        if panel is None:
+            panel = self._panels[index] = self._panel_factories[index]()
+            placeholder = self.content_stack.widget(index)
+            self.content_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.content_stack.insertWidget(index, panel)
+            if index == 1:
+                panel.set_gui_active(self.content_stack.currentIndex() == 1)
+        return panel
+        
+    def _show_panel(self, index):
+        """Make a main panel current, creating it if needed"""
+        self._get_panel(index)
+        self.content_stack.setCurrentIndex(index)
+        
+    @property
+    def simulation_builder(self):
+        return self._get_panel(0)
+        
+    @property
+    def simulation_runner(self):
+        return self._get_panel(1)
+        
+    @property
+    def result_viewer(self):
+        return self._get_panel(2)
+        
     def create_side_panel(self):
         """Create the side navigation panel"""
         side_widget = QWidget()
@@ -122,45 +154,63 @@ class StarfishMainWindow(QMainWindow):
         
     def setup_connections(self):
         """Setup signal-slot connections"""
+        if self._connected:
+            return  # a second call would connect every slot twice
+        self._connected = True
+        
         self.nav_button_group.buttonClicked.connect(self.on_nav_button_clicked)
+        self.content_stack.currentChanged.connect(self._on_panel_changed)
         self.settings_button.clicked.connect(self.show_settings)
         self.about_button.clicked.connect(self.show_about)
 
         # Set default selection
         self.build_button.setChecked(True)
-        self.content_stack.setCurrentIndex(0)
+        self._show_panel(0)
 
     def on_nav_button_clicked(self, button):
         """Handle navigation button clicks"""
         button_id = self.nav_button_group.id(button)
-        self.content_stack.setCurrentIndex(button_id)
+        self._show_panel(button_id)
 
         # Update window title based on current panel
         panel_names = ["Build Simulation File", "Run Simulation", "View Results"]
         if 0 <= button_id < len(panel_names):
             self.setWindowTitle(f"Starfish 0.22-Python - {panel_names[button_id]}")
         
+    def _on_panel_changed(self, index):
+        """Let the runner skip console/progress work while it is not the visible panel"""
+        runner = self._panels[1]
+        if runner is not None:
+            runner.set_gui_active(index == 1)
+            
     def show_simulation_builder(self):
         """Show the simulation file builder"""
         self.build_button.setChecked(True)
-        self.content_stack.setCurrentIndex(0)
+        self._show_panel(0)
         
     def show_simulation_runner(self):
         """Show the simulation runner"""
         self.run_button.setChecked(True)
-        self.content_stack.setCurrentIndex(1)
+        self._show_panel(1)
         
     def show_result_viewer(self):
         """Show the result viewer"""
         self.view_button.setChecked(True)
-        self.content_stack.setCurrentIndex(2)
+        self._show_panel(2)
         
     def show_settings(self):
         """Show settings dialog"""
-        dialog = SettingsDialog(self.options, self)
-        if dialog.exec_() == QDialog.Accepted:
+        # Built once and reused; each open starts from the current options
+        if self.settings_dialog is None:
+            self.settings_dialog = SettingsDialog(self.options, self)
+        else:
+            self.settings_dialog.refresh(self.options)
+        if self.settings_dialog.exec_() == QDialog.Accepted:
             # Settings were applied, update components if needed
-            self.simulation_runner.options = self.options
+            runner = self._panels[1]
+            if runner is not None:
+                runner.options = self.options
+                runner.clear_jar_cache()
             self.statusBar().showMessage("Settings updated", 2000)
         
     def show_about(self):
@@ -170,8 +220,9 @@ class StarfishMainWindow(QMainWindow):
         
     def closeEvent(self, event):
         """Handle window close event"""
-        # Check if simulation is running
-        if hasattr(self.simulation_runner, 'is_running') and self.simulation_runner.is_running():
+        # Check if simulation is running (never, if the runner was not opened)
+        runner = self._panels[1]
+        if runner is not None and runner.is_running():
             reply = QMessageBox.question(
                 self, 'Confirm Exit',
                 'A simulation is currently running. Are you sure you want to exit?',
@@ -180,7 +231,7 @@ class StarfishMainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.Yes:
-                self.simulation_runner.stop_simulation()
+                runner.stop_simulation()
                 event.accept()
             else:
                 event.ignore()
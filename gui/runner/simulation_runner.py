@@ -4,25 +4,89 @@ Equivalent to the Java GUISimulationRunner class
 """
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                             QProgressBar, QListWidget, QListWidgetItem,
-                             QSplitter, QTextEdit, QFileDialog, QMessageBox,
-                             QLabel, QGroupBox, QFormLayout)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QTextCursor
+                             QProgressBar, QListView,
+                             QSplitter, QPlainTextEdit, QFileDialog, QMessageBox,
+                             QLabel, QGroupBox, QFormLayout, QCheckBox)
+from PyQt5.QtCore import (Qt, QObject, pyqtSignal, QTimer, QAbstractListModel,
+                          QModelIndex, QProcess, QIODevice)
+from PyQt5.QtGui import QFont
 
-import subprocess
+import collections
+import locale
+import re
 import sys
 import os
+import tempfile
 from pathlib import Path
 import threading
 import time
 
 
-class SimulationWorker(QThread):
-    """Worker thread for running simulations"""
+# Iteration counter in the CLI's progress lines
+_ITERATION_RE = re.compile(rb'\bit:\s+(\d+)')
+
+# Subprocess output is decoded with the locale encoding, as a text-mode pipe would
+_OUTPUT_ENCODING = locale.getpreferredencoding(False)
+
+# Resolved StarfishCLI.jar per (cwd, working directory), so each run skips the search
+_JAR_CACHE = {}
+
+# Temporary file that receives a run's console output (starfish.log in the working
+# directory is the solver's own log); kept only if the run does not succeed
+CONSOLE_LOG_PREFIX = "starfish_console_"
+
+# The CLI takes a single simulation file, so each queued run is its own JVM;
+# reuse the shared class data archive to cut that startup
+_JVM_FLAGS = ('-Xshare:auto',)
+
+# Most unread log output read back in one go when the runner panel is shown again
+_LOG_BACKLOG_LIMIT = 1 << 20
+
+
+def _latest_iteration(data):
+    """Iteration number from the last "it: 1234   Ar+: 0" line in data, or None"""
+    # Search back from the end and match only there, instead of running the
+    # regex over the whole chunk
+    pos = data.rfind(b'it:')
+    while pos >= 0:
+        match = _ITERATION_RE.match(data, pos)
+        if match:
+            return int(match.group(1))
+        pos = data.rfind(b'it:', 0, pos)
+    return None
+
+
+def _set_label_text(label, text):
+    """Set a label's text unless it already shows it"""
+    if label.text() != text:
+        label.setText(text)
+
+
+def _progress_heuristic(current_it):
+    """Percent-complete formula; only evaluated to build _PROGRESS_TABLE"""
+    # Assume typical simulation runs 1000-5000 iterations
+    if current_it <= 1000:
+        return min(100, current_it // 10)
+    if current_it <= 5000:
+        return min(100, 10 + (current_it - 1000) // 40)
+    return min(100, 90 + (current_it - 5000) // 500)
+
+
+# The heuristic evaluated for every iteration below the point where it stays at 100
+_PROGRESS_SATURATION = 10000
+_PROGRESS_TABLE = tuple(_progress_heuristic(i) for i in range(_PROGRESS_SATURATION))
+
+
+def _estimate_progress(current_it):
+    """Percent complete for an iteration count, looked up in _PROGRESS_TABLE at runtime"""
+    if current_it < _PROGRESS_SATURATION:
+        return _PROGRESS_TABLE[current_it]
+    return 100
+
+
+class SimulationWorker(QObject):
+    """Runs one simulation in a QProcess driven by the GUI event loop"""
     
-    progress_updated = pyqtSignal(int)
-    output_received = pyqtSignal(str)
     simulation_finished = pyqtSignal(int)  # exit code
     
     def __init__(self, simulation_file, options):
@@ -31,156 +95,204 @@ class SimulationWorker(QThread):
         self.options = options
         self.process = None
         self.should_stop = False
-        
-    def run(self):
-        """Run the simulation"""
-        try:
-            # Find the Java CLI jar file
-            jar_file = self.find_starfish_jar()
-            if not jar_file:
-                error_msg = ("Error: StarfishCLI.jar not found!\n"
-                           "Please ensure StarfishCLI.jar is in one of these locations:\n"
-                           "- Current directory\n"
-                           "- build/ directory\n"
-                           "- dist/ directory\n"
-                           "- target/ directory\n"
-                           "- Working directory\n")
-                self.output_received.emit(error_msg)
-                self.simulation_finished.emit(-1)
-                return
-
-            # 确定工作目录和仿真文件
-            sim_file_path = Path(self.simulation_file)
-            if sim_file_path.is_absolute():
-                working_dir = sim_file_path.parent
-                sim_file_name = sim_file_path.name
-            else:
-                working_dir = self.options.working_directory
-                sim_file_name = str(sim_file_path)
-
-            # 构建命令 - 只传递仿真文件名（相对路径）
-            cmd = ['java', '-jar', str(jar_file), sim_file_name]
-
-            self.output_received.emit(f"Starting simulation: {' '.join(cmd)}\n")
-            self.output_received.emit(f"Working directory: {working_dir}\n")
-            self.output_received.emit(f"Simulation file: {sim_file_name}\n")
-
-            # Start process in the correct working directory
-            self.process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1,
-                cwd=str(working_dir)  # 设置工作目录
-            )
-            
-            # Read output
-            while True:
-                if self.should_stop:
-                    self.process.terminate()
-                    break
-                    
-                output = self.process.stdout.readline()
-                if output == '' and self.process.poll() is not None:
-                    break
-                    
-                if output:
-                    self.output_received.emit(output)
-                    
-                    # Try to extract progress information
-                    if "it:" in output:
-                        try:
-                            # Parse iteration info for progress
-                            # Format: "it: 1234   Ar+: 0"
-                            if "it:" in output:
-                                parts = output.split()
-                                for i, part in enumerate(parts):
-                                    if part == "it:":
-                                        current_it = int(parts[i + 1])
-                                        # Estimate progress based on iteration count
-                                        # Assume typical simulation runs 1000-5000 iterations
-                                        if current_it <= 1000:
-                                            progress = min(100, current_it // 10)
-                                        elif current_it <= 5000:
-                                            progress = min(100, 10 + (current_it - 1000) // 40)
-                                        else:
-                                            progress = min(100, 90 + (current_it - 5000) // 500)
-                                        self.progress_updated.emit(progress)
-                                        break
-                        except:
-                            pass
-            
-            # Get exit code
-            exit_code = self.process.poll()
-            self.simulation_finished.emit(exit_code or 0)
-            
-        except Exception as e:
-            self.output_received.emit(f"Error running simulation: {e}\n")
-            self.simulation_finished.emit(-1)
+        # Messages for the console, picked up by the runner's output poll
+        self.out_queue = collections.deque()
+        self.log_path = None  # set once the process has been started
+        
+    def start(self):
+        """Start the simulation"""
+        # Find the Java CLI jar file
+        jar_file = self.find_starfish_jar()
+        if not jar_file:
+            error_msg = ("Error: StarfishCLI.jar not found!\n"
+                       "Please ensure StarfishCLI.jar is in one of these locations:\n"
+                       "- Current directory\n"
+                       "- build/ directory\n"
+                       "- dist/ directory\n"
+                       "- target/ directory\n"
+                       "- Working directory\n")
+            self._fail(error_msg)
+            return
+
+        # 确定工作目录和仿真文件
+        sim_file_path = Path(self.simulation_file)
+        if sim_file_path.is_absolute():
+            working_dir = sim_file_path.parent
+            sim_file_name = sim_file_path.name
+        else:
+            working_dir = self.options.working_directory
+            sim_file_name = str(sim_file_path)
+
+        # 构建命令 - 只传递仿真文件名（相对路径）
+        cmd = ['java', *_JVM_FLAGS, '-jar', str(jar_file), sim_file_name]
+
+        self.out_queue.append(f"Starting simulation: {' '.join(cmd)}\n")
+        self.out_queue.append(f"Working directory: {working_dir}\n")
+        self.out_queue.append(f"Simulation file: {sim_file_name}\n")
+
+        # Start process in the correct working directory. Its output goes
+        # straight to a log file that the GUI tails, not through Python.
+        log_fd, log_path = tempfile.mkstemp(prefix=CONSOLE_LOG_PREFIX, suffix=".log")
+        os.close(log_fd)
+        self.log_path = Path(log_path)
+        self.process = QProcess(self)
+        self.process.setWorkingDirectory(str(working_dir))  # 设置工作目录
+        self.process.setProcessChannelMode(QProcess.MergedChannels)
+        self.process.setStandardOutputFile(str(self.log_path), QIODevice.Truncate)
+        self.process.finished.connect(self._on_finished)
+        self.process.errorOccurred.connect(self._on_error)
+        self.process.start(cmd[0], cmd[1:])
+        
+    def wait(self, timeout=None):
+        """Block until the simulation process has exited"""
+        if self.process is not None and self.process.state() != QProcess.NotRunning:
+            self.process.waitForFinished(-1 if timeout is None else int(timeout * 1000))
             
     def stop(self):
         """Stop the simulation"""
         self.should_stop = True
-        if self.process:
-            self.process.terminate()
+        if self.process is not None and self.process.state() != QProcess.NotRunning:
+            if sys.platform == 'win32':
+                # terminate() only posts WM_CLOSE, which a console JVM ignores
+                self.process.kill()
+            else:
+                self.process.terminate()
+                
+    def _on_finished(self, exit_code, exit_status):
+        # A stopped run is reported by the runner itself
+        if self.should_stop:
+            return
+        if exit_status == QProcess.CrashExit:
+            exit_code = -1
+        elif sys.platform == 'win32':
+            exit_code &= 0xFFFFFFFF  # Qt hands back the DWORD exit code as a signed int
+        self.simulation_finished.emit(exit_code)
+        
+    def _on_error(self, error):
+        # finished is not emitted for a process that never started
+        if error == QProcess.FailedToStart and not self.should_stop:
+            self._fail(f"Error running simulation: {self.process.errorString()}\n")
+            
+    def _fail(self, message):
+        self.out_queue.append(message)
+        # Reported from the event loop, like a process that has finished
+        QTimer.singleShot(0, lambda: self.simulation_finished.emit(-1))
             
     def find_starfish_jar(self):
         """Find the Starfish CLI jar file"""
+        cache_key = (os.getcwd(), str(getattr(self.options, 'working_directory', '')))
+        jar_file = _JAR_CACHE.get(cache_key)
+        if jar_file is not None and os.path.isfile(jar_file):
+            return jar_file
+        jar_file = self._search_starfish_jar()
+        if jar_file is not None:
+            _JAR_CACHE[cache_key] = jar_file
+        return jar_file
+        
+    def _search_starfish_jar(self):
+        """Probe the usual locations for the Starfish CLI jar file"""
+        # Plain string paths: each probe is a single stat call
+        cwd = os.getcwd()
+        jar_name = "StarfishCLI.jar"
         # Look in common locations
         possible_paths = [
-            Path.cwd() / "StarfishCLI.jar",
-            Path.cwd() / "build" / "StarfishCLI.jar",
-            Path.cwd() / "dist" / "StarfishCLI.jar",
-            Path.cwd() / "target" / "StarfishCLI.jar",
-            Path.cwd().parent / "StarfishCLI.jar",  # Parent directory
-            Path.cwd() / "lib" / "StarfishCLI.jar",  # Lib directory
+            os.path.join(cwd, jar_name),
+            os.path.join(cwd, "build", jar_name),
+            os.path.join(cwd, "dist", jar_name),
+            os.path.join(cwd, "target", jar_name),
+            os.path.join(os.path.dirname(cwd), jar_name),  # Parent directory
+            os.path.join(cwd, "lib", jar_name),  # Lib directory
         ]
 
         # Also check if it's in the working directory
         if hasattr(self.options, 'working_directory'):
-            wd = Path(self.options.working_directory)
+            wd = os.fspath(self.options.working_directory)
             possible_paths.extend([
-                wd / "StarfishCLI.jar",
-                wd / "build" / "StarfishCLI.jar",
-                wd / "dist" / "StarfishCLI.jar",
+                os.path.join(wd, jar_name),
+                os.path.join(wd, "build", jar_name),
+                os.path.join(wd, "dist", jar_name),
             ])
 
         for path in possible_paths:
-            if path.exists():
+            if os.path.isfile(path):
                 return path
 
         # If not found, try to find any jar file that might be Starfish
-        for jar_file in Path.cwd().glob("*.jar"):
-            if "starfish" in jar_file.name.lower():
-                return jar_file
+        with os.scandir(cwd) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".jar") and "starfish" in name.lower() and entry.is_file():
+                    return entry.path
 
         return None
 
 
-class SimulationQueue(QListWidget):
+class QueueModel(QAbstractListModel):
+    """List model over the queued simulation files"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items = collections.deque()  # Path objects, next simulation first
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return str(self._items[index.row()])
+        if role == Qt.UserRole:
+            return self._items[index.row()]
+        return None
+        
+    def add(self, path):
+        """Append a file to the end of the queue"""
+        row = len(self._items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.append(path)
+        self.endInsertRows()
+        
+    def pop_front(self):
+        """Remove and return the first file, or None if the queue is empty"""
+        if not self._items:
+            return None
+        self.beginRemoveRows(QModelIndex(), 0, 0)
+        path = self._items.popleft()
+        self.endRemoveRows()
+        return path
+        
+    def clear(self):
+        """Remove all files"""
+        self.beginResetModel()
+        self._items.clear()
+        self.endResetModel()
+
+
+class SimulationQueue(QListView):
     """Queue widget for managing simulation files"""
     
     def __init__(self):
         super().__init__()
         self.setMaximumHeight(150)
+        self.queue_model = QueueModel(self)
+        self.setModel(self.queue_model)
         
     def add_simulation(self, file_path):
         """Add a simulation file to the queue"""
-        item = QListWidgetItem(str(file_path))
-        item.setData(Qt.UserRole, file_path)
-        self.addItem(item)
+        self.queue_model.add(file_path)
         
     def get_next_simulation(self):
         """Get the next simulation from the queue"""
-        if self.count() > 0:
-            item = self.takeItem(0)
-            return item.data(Qt.UserRole)
-        return None
+        return self.queue_model.pop_front()
         
     def clear_queue(self):
         """Clear all items from the queue"""
-        self.clear()
+        self.queue_model.clear()
+        
+    def count(self):
+        """Number of queued simulations"""
+        return self.queue_model.rowCount()
 
 
 class SimulationRunner(QWidget):
@@ -191,6 +303,7 @@ class SimulationRunner(QWidget):
         self.options = options
         self.current_worker = None
         self.is_running_simulation = False
+        self._stop_requested = False
         
         self.init_ui()
         
@@ -210,12 +323,33 @@ class SimulationRunner(QWidget):
         splitter.addWidget(left_panel)
         
         # Right side: Console output
-        self.console = QTextEdit()
+        self.console = QPlainTextEdit()
         self.console.setReadOnly(True)
         self.console.setFont(QFont("Consolas", 9))
         self.console.setStyleSheet("background-color: #1e1e1e; color: #ffffff;")
+        self.console.setMaximumBlockCount(5000)  # keep only the latest lines
+        self.console.setUndoRedoEnabled(False)  # append-only log, no undo history
         splitter.addWidget(self.console)
         
+        # Output is buffered and written to the console in one insert per tick
+        self._console_pending = collections.deque()
+        self._console_timer = QTimer(self)
+        self._console_timer.setSingleShot(True)
+        self._console_timer.setInterval(80)
+        self._console_timer.timeout.connect(self._flush_console)
+        
+        # Output and progress are only applied while the panel is shown
+        self._gui_active = True
+        self._pending_progress = None
+        self._last_progress = None  # last value passed to update_progress
+        
+        # Polls the running worker's message queue and tails its console log
+        self._log_file = None
+        self._log_tail = b''
+        self._output_poll_timer = QTimer(self)
+        self._output_poll_timer.setInterval(150)
+        self._output_poll_timer.timeout.connect(self._drain_worker_output)
+        
         # Set splitter proportions
         splitter.setSizes([250, 550])
         
@@ -278,6 +412,10 @@ class SimulationRunner(QWidget):
         self.simulation_queue = SimulationQueue()
         queue_layout.addWidget(self.simulation_queue)
         
+        self.run_all_checkbox = QCheckBox("Run all without asking")
+        self.run_all_checkbox.setChecked(False)
+        queue_layout.addWidget(self.run_all_checkbox)
+        
         layout.addWidget(queue_group)
         
         # Status
@@ -325,22 +463,24 @@ class SimulationRunner(QWidget):
             return
             
         self.is_running_simulation = True
+        self._stop_requested = False
         self.start_button.setEnabled(False)
         self.pause_button.setEnabled(True)
         self.stop_button.setEnabled(True)
         
-        self.status_label.setText("Running")
-        self.current_file_label.setText(next_sim.name)
+        _set_label_text(self.status_label, "Running")
+        _set_label_text(self.current_file_label, next_sim.name)
         
         # Clear console
+        self._console_pending.clear()
+        self._log_tail = b''
         self.console.clear()
         
         # Start worker thread
         self.current_worker = SimulationWorker(next_sim, self.options)
-        self.current_worker.progress_updated.connect(self.update_progress)
-        self.current_worker.output_received.connect(self.append_to_console)
         self.current_worker.simulation_finished.connect(self.on_simulation_finished)
         self.current_worker.start()
+        self._output_poll_timer.start()
         
     def pause_simulation(self):
         """Pause the current simulation"""
@@ -360,24 +500,113 @@ class SimulationRunner(QWidget):
         
     def stop_simulation(self):
         """Stop the current simulation"""
+        self._stop_requested = True
         if self.current_worker:
             self.current_worker.stop()
             self.current_worker.wait()
             
         self.on_simulation_finished(-1)
         
+    def set_gui_active(self, active):
+        """Hold console and progress updates while the panel is hidden, apply them when shown"""
+        if active == self._gui_active:
+            return
+        self._gui_active = active
+        if active:
+            if self._pending_progress is not None:
+                self.progress_bar.setValue(self._pending_progress)
+                self._pending_progress = None
+            if self.is_running_simulation:
+                self._drain_worker_output()
+            self._flush_console()
+            
     def update_progress(self, value):
         """Update the progress bar"""
+        if value == self._last_progress:
+            return
+        self._last_progress = value
+        if not self._gui_active:
+            self._pending_progress = value
+            return
         self.progress_bar.setValue(value)
         
     def append_to_console(self, text):
-        """Append text to the console"""
-        self.console.moveCursor(QTextCursor.End)
-        self.console.insertPlainText(text)
-        self.console.moveCursor(QTextCursor.End)
+        """Queue text for the console; it is written on the next flush"""
+        self._console_pending.append(text)
+        if not self._console_timer.isActive():
+            self._console_timer.start()
+            
+    def _flush_console(self):
+        """Write all queued console text with a single insert"""
+        self._console_timer.stop()
+        if not self._console_pending or not self._gui_active:
+            return  # kept until the panel is shown again
+        chunk = "".join(self._console_pending)
+        self._console_pending.clear()
+        # appendPlainText starts a new line itself, so drop the chunk's final newline
+        self.console.appendPlainText(chunk[:-1] if chunk.endswith("\n") else chunk)
+        
+    def _drain_worker_output(self, final=False):
+        """Move the worker's messages and new simulation output into the console in one write"""
+        worker = self.current_worker
+        if worker is None:
+            return
+        pending = self._console_pending
+        pending.extend(worker.out_queue)
+        worker.out_queue.clear()
+            
+        if self._log_file is None and worker.log_path is not None:
+            try:
+                # Unbuffered: each poll reads straight from the fd, no BufferedReader copy
+                self._log_file = open(worker.log_path, 'rb', buffering=0)
+            except OSError:
+                pass  # not created yet
+        # While hidden the log file itself is the buffer, so it is not read
+        if self._log_file is not None and (self._gui_active or final):
+            skipped = self._skip_log_backlog()
+            data = self._log_file.read() or b''
+            if skipped:
+                # Resume after the partial line the jump landed in
+                pending.append(f"[... earlier output skipped, see {worker.log_path} ...]\n")
+                data = data[data.find(b'\n') + 1:]
+            data = self._log_tail + data
+            # Hold back a trailing partial line until it is complete
+            end = len(data) if final else data.rfind(b'\n') + 1
+            lines, self._log_tail = data[:end], data[end:]
+            if lines:
+                pending.append(lines.decode(_OUTPUT_ENCODING, 'replace').replace('\r\n', '\n'))
+                # Only the latest iteration matters for the progress bar
+                current_it = _latest_iteration(lines)
+                if current_it is not None:
+                    self.update_progress(_estimate_progress(current_it))
+            if final:
+                self._log_file.close()
+                self._log_file = None
+                
+        self._flush_console()
+        
+    def _skip_log_backlog(self):
+        """Jump to the last part of a large unread log; True if output was skipped"""
+        log = self._log_file
+        backlog = os.fstat(log.fileno()).st_size - log.tell()
+        if backlog <= _LOG_BACKLOG_LIMIT:
+            return False
+        # The console keeps only its last lines anyway
+        log.seek(-_LOG_BACKLOG_LIMIT, os.SEEK_END)
+        self._log_tail = b''
+        return True
         
     def on_simulation_finished(self, exit_code):
         """Handle simulation completion"""
+        # Output still queued by the worker comes before the completion message
+        self._output_poll_timer.stop()
+        self._drain_worker_output(final=True)
+        log_path = None
+        if self.current_worker is not None:
+            log_path = self.current_worker.log_path
+            # Done with this run: release the worker and its connections
+            self.current_worker.deleteLater()
+            self.current_worker = None
         self.is_running_simulation = False
         self.start_button.setEnabled(True)
         self.pause_button.setEnabled(False)
@@ -386,29 +615,47 @@ class SimulationRunner(QWidget):
         # Handle different exit codes
         # Note: Windows can return large unsigned values for negative exit codes
         if exit_code == 0:
-            self.status_label.setText("Completed")
+            _set_label_text(self.status_label, "Completed")
             self.append_to_console("\nSimulation completed successfully\n")
         elif exit_code == 4294967295:  # This is -1 as unsigned 32-bit
-            self.status_label.setText("Completed with warnings")
+            _set_label_text(self.status_label, "Completed with warnings")
             self.append_to_console("\nSimulation completed with warnings (output errors)\n")
         else:
-            self.status_label.setText("Failed")
+            _set_label_text(self.status_label, "Failed")
             self.append_to_console(f"\nSimulation failed with exit code {exit_code}\n")
+            
+        # The console output of a run that did not succeed is kept for inspection
+        if log_path is not None:
+            try:
+                if exit_code == 0 or log_path.stat().st_size == 0:
+                    log_path.unlink()
+                else:
+                    self.append_to_console(f"Console output saved to {log_path}\n")
+            except OSError:
+                pass
 
-        self.current_file_label.setText("None")
-        self.progress_bar.setValue(100)  # Show completion
+        _set_label_text(self.current_file_label, "None")
+        self.update_progress(100)  # Show completion
+        self._flush_console()
 
         # Check if there are more simulations in queue
         if self.simulation_queue.count() > 0:
-            reply = QMessageBox.question(
-                self, "Continue Queue",
-                "There are more simulations in the queue. Continue?",
-                QMessageBox.Yes | QMessageBox.No
-            )
+            if self.run_all_checkbox.isChecked() and not self._stop_requested:
+                reply = QMessageBox.Yes
+            else:
+                reply = QMessageBox.question(
+                    self, "Continue Queue",
+                    "There are more simulations in the queue. Continue?",
+                    QMessageBox.Yes | QMessageBox.No
+                )
 
             if reply == QMessageBox.Yes:
-                QTimer.singleShot(1000, self.start_simulation)  # Start next after 1 second
+                QTimer.singleShot(0, self.start_simulation)  # Start next once this slot returns
                 
     def is_running(self):
         """Check if a simulation is currently running"""
         return self.is_running_simulation
+        
+    def clear_jar_cache(self):
+        """Search for StarfishCLI.jar again on the next run, e.g. after settings change"""
+        _JAR_CACHE.clear()
@@ -9,22 +9,214 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
                              QGroupBox, QFormLayout, QComboBox, QCheckBox,
                              QSlider, QLabel, QPushButton, QSpinBox,
                              QDoubleSpinBox, QColorDialog, QTabWidget)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtCore import (Qt, QTimer, pyqtSignal, QObject, QRunnable, QThreadPool,
+                          QFileSystemWatcher)
 from PyQt5.QtGui import QColor
 
 import vtk
 from vtk.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
+from vtk.numpy_interface import dataset_adapter as dsa
+from vtk.util.numpy_support import numpy_to_vtk
 import numpy as np
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-import xml.etree.ElementTree as ET
+
+
+# Handlers and levels are left to the application's logging configuration; without
+# one, only warnings and errors reach stderr, so routine load messages stay quiet
+log = logging.getLogger(__name__)
+
+
+# Hue ranges used for a colormap when matplotlib is not available
+_COLORMAP_HUE_RANGES = {
+    'plasma': (0.8, 0.0),  # Purple to yellow
+    'rainbow': (0.0, 0.667),  # Red to blue
+}
+_DEFAULT_HUE_RANGE = (0.667, 0.0)  # Blue to red
+
+
+# Frame number at the end of a file name, e.g. "field_0012.vts"
+_FRAME_NUMBER_RE = re.compile(r'^(.*?)(\d+)$')
+
+
+def _vts_files(directory):
+    """(path, mtime) of the VTS files directly in a directory, from one listing"""
+    files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith('.vts') and entry.is_file():
+                files.append((entry.path, entry.stat().st_mtime))
+    return files
+
+
+def _series_files(file_path):
+    """Files of the time series a result file belongs to, sorted by frame number"""
+    path = Path(file_path)
+    match = _FRAME_NUMBER_RE.match(path.stem)
+    if not match:
+        return [path]
+    prefix, suffix = match.group(1), path.suffix
+    frames = []
+    with os.scandir(path.parent) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(suffix):
+                number = name[len(prefix):len(name) - len(suffix)]
+                if number.isdigit():
+                    frames.append((int(number), Path(entry.path)))
+    frames.sort()
+    return [frame for _, frame in frames]
+
+
+_READER_TYPES = {
+    '.vts': vtk.vtkXMLStructuredGridReader,
+    '.vtr': vtk.vtkXMLRectilinearGridReader,
+    '.vtp': vtk.vtkXMLPolyDataReader,
+    '.vtk': vtk.vtkDataSetReader,
+}
+
+# Readers are reused across loads; a reader runs one read at a time, so each
+# pool thread keeps its own set
+_thread_readers = threading.local()
+
+
+def _reader_for(file_ext):
+    """This thread's reader for a file extension, or None for an unsupported format"""
+    readers = getattr(_thread_readers, 'by_ext', None)
+    if readers is None:
+        readers = _thread_readers.by_ext = {}
+    reader = readers.get(file_ext)
+    if reader is None:
+        reader_type = _READER_TYPES.get(file_ext)
+        if reader_type is None:
+            return None
+        reader = readers[file_ext] = reader_type()
+    return reader
+
+
+def _as_image_data(data):
+    """A structured grid on a uniform axis-aligned lattice as vtkImageData sharing its arrays, else None"""
+    if not data.IsA('vtkStructuredGrid') or data.GetNumberOfPoints() < 2:
+        return None
+    dims = [0, 0, 0]
+    data.GetDimensions(dims)
+    nx, ny, nz = dims
+    points = dsa.WrapDataObject(data).Points.reshape(nz, ny, nx, 3)
+    origin = points[0, 0, 0]
+    steps = (points[0, 0, min(1, nx - 1)], points[0, min(1, ny - 1), 0], points[min(1, nz - 1), 0, 0])
+    spacing = [step[axis] - origin[axis] if n > 1 else 1.0
+               for axis, (step, n) in enumerate(zip(steps, dims))]
+    if min(spacing) <= 0:
+        return None
+    # Every point must sit on the lattice given by the first point and spacing
+    tolerance = 1e-4 * min(spacing)
+    for axis, shape in enumerate(((1, 1, nx), (1, ny, 1), (nz, 1, 1))):
+        lattice = origin[axis] + spacing[axis] * np.arange(dims[axis]).reshape(shape)
+        if not np.allclose(points[..., axis], lattice, rtol=0.0, atol=tolerance):
+            return None
+    image = vtk.vtkImageData()
+    image.SetDimensions(dims)
+    image.SetOrigin(origin)
+    image.SetSpacing(spacing)
+    image.GetPointData().ShallowCopy(data.GetPointData())
+    return image
+
+
+def _read_dataset(file_path, field=None):
+    """Read a VTK data file; (reader, dataset, mtime, point array names), or None for an unsupported format
+
+    If the file has a point array named field, only that array is read.
+    """
+    file_ext = Path(file_path).suffix.lower()
+
+    # Choose appropriate reader based on file extension
+    reader = _reader_for(file_ext)
+    if reader is None:
+        log.warning("Unsupported file format: %s", file_ext)
+        return None
+
+    # Taken before reading, so a write during the read is picked up next time
+    mtime = os.path.getmtime(file_path)
+    reader.SetFileName(str(file_path))
+    reader.Modified()  # the same file name would otherwise not be read again
+
+    # The XML readers list the arrays from the file header, so the unused ones are skipped
+    if hasattr(reader, 'GetPointDataArraySelection'):
+        reader.UpdateInformation()
+        selection = reader.GetPointDataArraySelection()
+        field_names = [selection.GetArrayName(i) for i in range(selection.GetNumberOfArrays())]
+        if field in field_names:
+            selection.DisableAllArrays()
+            selection.EnableArray(field)
+        else:
+            selection.EnableAllArrays()
+    else:
+        field_names = None
+    reader.Update()
+    # The reader's output is refilled by its next read; the arrays are shared, not copied
+    output = reader.GetOutput()
+    data = output.NewInstance()
+    data.ShallowCopy(output)
+    # A uniform grid needs no point coordinates, and a 2D one can be drawn as a texture
+    image = _as_image_data(data)
+    if image is not None:
+        data = image
+    if field_names is None:
+        point_data = data.GetPointData()
+        field_names = [point_data.GetArrayName(i) for i in range(point_data.GetNumberOfArrays())]
+    return reader, data, mtime, field_names
+
+
+class VtkLoadWorker(QRunnable):
+    """Reads a VTK data file on a pool thread, off the GUI thread"""
+    
+    class Signals(QObject):
+        finished = pyqtSignal(str, object)  # path, _read_dataset() result or None
+        
+    def __init__(self, file_path, field=None):
+        super().__init__()
+        self.file_path = str(file_path)
+        self.field = field
+        self.signals = VtkLoadWorker.Signals()
+        
+    def run(self):
+        try:
+            result = _read_dataset(self.file_path, self.field)
+        except Exception:
+            log.error("Error loading VTK file %s", self.file_path, exc_info=True)
+            result = None
+        self.signals.finished.emit(self.file_path, result)
 
 
 class VTKVisualizationWidget(QWidget):
     """Widget containing VTK visualization"""
     
+    dataset_loaded = pyqtSignal(str)  # path, once an asynchronous load is shown
+    
+    RECENT_FILES = 4  # reads kept in memory
+    
     def __init__(self):
         super().__init__()
         self.reader = None  # Store the VTK reader
+        self.field_names = []  # point arrays in the shown file, read or not
+        self._wrapped = None  # NumPy view of the loaded dataset
+        # Loaded file and its scene, reused until the file changes on disk
+        self._path = None
+        self._mtime = None
+        self._data = None
+        self._pending_path = None  # file being read on the thread pool
+        self._pending_field = None
+        self._pending_arrays_only = False
+        self._luts = {}  # colormap name -> vtkLookupTable, built on first use
+        # Recently read files, so going back to a frame does not read it again
+        self._recent = OrderedDict()  # (path, field) -> _read_dataset() result
+        self._edges = None  # mesh overlay, built the first time it is shown
+        self.edge_actor = None
+        self._static_enabled = False  # mapper keeps its geometry between datasets
         self.init_vtk()
         
     def init_vtk(self):
@@ -53,118 +245,273 @@ class VTKVisualizationWidget(QWidget):
         self.camera.SetFocalPoint(0, 0, 0)
         self.camera.SetViewUp(0, 1, 0)
         
-        # Initialize interactor
+        # Dataset pipeline, created once; loading a file only swaps the source's output.
+        # Files are read (and copied) on worker threads, so the mappers are fed from a
+        # producer rather than the reader port; their inputs are then only re-executed
+        # when the shown dataset is replaced or modified
+        self._source = vtk.vtkTrivialProducer()
+        # Use the same approach as Java version - simple DataSetMapper
+        self.mapper = vtk.vtkDataSetMapper()
+        self.mapper.SetInputConnection(self._source.GetOutputPort())
+        # Enable scalar visibility and set scalar mode (like Java version)
+        self.mapper.SetScalarVisibility(1)  # Use 1 instead of True for compatibility
+        self.mapper.SetScalarModeToUsePointData()
+        self.mapper.SetColorModeToMapScalars()
+        # Upload raw scalars and map them through the table as a texture on the GPU,
+        # instead of building an RGBA color per point on the CPU
+        self.mapper.InterpolateScalarsBeforeMappingOn()
+        
+        # Create and configure lookup table (like Java version)
+        self.lut = vtk.vtkLookupTable()
+        self.lut.SetHueRange(0.667, 0.0)  # Blue to red
+        self.lut.SetSaturationRange(1.0, 1.0)
+        self.lut.SetValueRange(1.0, 1.0)
+        self.lut.SetNumberOfColors(256)
+        self.lut.Build()
+        # Don't use SetUseLookupTableScalarRange, let mapper handle the range
+        self.mapper.SetLookupTable(self.lut)
+        
+        self.actor = vtk.vtkActor()
+        self.actor.SetMapper(self.mapper)
+        self._property = self.actor.GetProperty()  # held, so setters skip the lookup
+        
+        # A 2D image is drawn as one textured slice instead of a surface of quads;
+        # its colors follow the table range, which is kept at the mapper's range
+        self.image_mapper = vtk.vtkImageSliceMapper()
+        self.image_actor = vtk.vtkImageSlice()
+        self.image_actor.SetMapper(self.image_mapper)
+        self.image_actor.VisibilityOff()
+        self._image_property = self.image_actor.GetProperty()
+        self._image_property.SetLookupTable(self.lut)
+        self._image_property.UseLookupTableScalarRangeOn()
+        self._image_property.SetInterpolationTypeToLinear()
+        
+        # Scalar bar for color legend (like Java version)
+        self.scalar_bar = vtk.vtkScalarBarActor()
+        self.scalar_bar.SetLookupTable(self.lut)
+        self.scalar_bar.SetNumberOfLabels(4)  # Use 4 like Java version
+        self.scalar_bar.SetPosition(0.85, 0.1)
+        self.scalar_bar.SetWidth(0.1)
+        self.scalar_bar.SetHeight(0.8)
+        
+        # Initialize interactor; its events come from Qt's event loop, so it is not started
         self.interactor.Initialize()
-        self.interactor.Start()
+        
+    def _is_shown(self, file_path):
+        """True if a file is the shown one and unchanged on disk since it was read"""
+        if str(file_path) != self._path:
+            return False
+        try:
+            return os.path.getmtime(file_path) == self._mtime
+        except OSError:
+            return False
+            
+    def needs_reload(self, file_path):
+        """True if a file is not loaded, or changed on disk since it was, and is not being read"""
+        if str(file_path) == self._pending_path:
+            return False
+        return os.path.exists(file_path) and not self._is_shown(file_path)
+            
+    def ensure_loaded(self, file_path, selected_field=None):
+        """Load a file unless it is already loaded and unchanged on disk; True if it was read"""
+        if str(file_path) == self._pending_path:
+            return False  # being read on the thread pool
+        if not os.path.exists(file_path) or self._is_shown(file_path):
+            return False
+        return self.load_vts_file(file_path, selected_field)
         
     def load_vts_file(self, file_path, selected_field=None):
         """Load a VTS (VTK Structured Grid) file"""
         try:
-            file_ext = Path(file_path).suffix.lower()
-
-            # Choose appropriate reader based on file extension
-            if file_ext == '.vts':
-                self.reader = vtk.vtkXMLStructuredGridReader()
-            elif file_ext == '.vtr':
-                self.reader = vtk.vtkXMLRectilinearGridReader()
-            elif file_ext == '.vtp':
-                self.reader = vtk.vtkXMLPolyDataReader()
-            elif file_ext == '.vtk':
-                self.reader = vtk.vtkDataSetReader()
-            else:
-                print(f"Unsupported file format: {file_ext}")
-                return False
-
-            self.reader.SetFileName(str(file_path))
-            self.reader.Update()
+            self._path = None
+            result = self._cached_result(file_path, selected_field)
+            if result is None:
+                result = _read_dataset(file_path, selected_field)
+        except Exception:
+            log.error("Error loading VTK file %s", file_path, exc_info=True)
+            return False
+        if result is None:
+            return False
+        self._remember(str(file_path), selected_field, result)
+        return self._apply_loaded_dataset(str(file_path), *result, selected_field)
+        
+    def _cached_result(self, file_path, field):
+        """A recent read of a file, if it has not changed on disk since"""
+        key = (str(file_path), field)
+        result = self._recent.get(key)
+        if result is None:
+            return None
+        try:
+            if os.path.getmtime(file_path) == result[2]:
+                self._recent.move_to_end(key)
+                return result
+        except OSError:
+            pass
+        del self._recent[key]
+        return None
+        
+    def _remember(self, file_path, field, result):
+        """Keep a read for _cached_result, dropping the least recently used beyond RECENT_FILES"""
+        self._recent[(file_path, field)] = result
+        self._recent.move_to_end((file_path, field))
+        while len(self._recent) > self.RECENT_FILES:
+            self._recent.popitem(last=False)
+        
+    def load_vts_file_async(self, file_path, selected_field=None, arrays_only=False):
+        """Read a file on the thread pool; dataset_loaded is emitted once it is shown"""
+        if self._is_shown(file_path) and self._has_field(selected_field):
+            # Nothing to read; a read still in flight for another file is dropped
+            self._pending_path = None
+            self.set_field(selected_field)
+            self.dataset_loaded.emit(str(file_path))
+            return
+        if str(file_path) == self._pending_path and selected_field == self._pending_field:
+            return  # already being read
+        self._pending_path = str(file_path)
+        self._pending_field = selected_field
+        self._pending_arrays_only = arrays_only
+        cached = self._cached_result(file_path, selected_field)
+        if cached is not None:
+            self._on_dataset_read(str(file_path), cached)
+            return
+        worker = VtkLoadWorker(file_path, selected_field)
+        worker.signals.finished.connect(self._on_dataset_read)
+        QThreadPool.globalInstance().start(worker)
+        
+    def _on_dataset_read(self, file_path, result):
+        """Show a dataset read by a VtkLoadWorker, unless a later load replaced it"""
+        if file_path != self._pending_path:
+            return
+        self._pending_path = None
+        if result is None:
+            return
+        self._remember(file_path, self._pending_field, result)
+        if self._pending_arrays_only and self._same_geometry(result[1]):
+            self._replace_arrays(file_path, *result, self._pending_field)
+            self.dataset_loaded.emit(file_path)
+        elif self._apply_loaded_dataset(file_path, *result, self._pending_field):
+            self.dataset_loaded.emit(file_path)
+            
+    def reload_arrays_only(self, file_path, selected_field=None):
+        """Re-read a file on the thread pool, keeping the shown mesh and camera if its geometry is unchanged"""
+        self.load_vts_file_async(file_path, selected_field, arrays_only=True)
+        
+    def _same_geometry(self, data):
+        """True if a dataset has the same type, extent and bounds as the shown one"""
+        shown = self._data
+        if shown is None or data.GetClassName() != shown.GetClassName():
+            return False
+        if data.GetNumberOfPoints() != shown.GetNumberOfPoints():
+            return False
+        if hasattr(data, 'GetExtent') and data.GetExtent() != shown.GetExtent():
+            return False
+        return data.GetBounds() == shown.GetBounds()
+        
+    def _has_field(self, field):
+        """False if a field is in the shown file but its array was not read"""
+        if self._data is None or not field or field not in self.field_names:
+            return True
+        return self._data.GetPointData().GetArray(field) is not None
+        
+    def _replace_arrays(self, file_path, reader, data, mtime, field_names, selected_field=None):
+        """Swap the point data of the shown dataset for that of a re-read one"""
+        point_data = self._data.GetPointData()
+        active = point_data.GetScalars()
+        field = active.GetName() if active else None
+        if selected_field and data.GetPointData().GetArray(selected_field):
+            field = selected_field
+        # The shown dataset is changed in place, so a kept read of it no longer holds its arrays
+        for key in [key for key, kept in self._recent.items() if kept[1] is self._data]:
+            del self._recent[key]
+        # Arrays are shared by reference, not copied
+        point_data.ShallowCopy(data.GetPointData())
+        self._data.Modified()
+        self._wrapped = dsa.WrapDataObject(self._data)
+        if field and point_data.GetArray(field):
+            point_data.SetActiveScalars(field)
+            self._fit_colors(field)
+        self.reader = reader
+        self.field_names = field_names
+        self._path = file_path
+        self._mtime = mtime
+        self.render_window.Render()
+            
+    def _apply_loaded_dataset(self, file_path, reader, data, mtime, field_names, selected_field=None):
+        """Show a dataset that has been read from file_path"""
+        try:
+            self._path = None
+            self.reader = reader
+            self.field_names = field_names
 
-            # Get data
-            data = self.reader.GetOutput()
+            # The wrapper exposes the arrays as NumPy views without copying
+            self._wrapped = dsa.WrapDataObject(data)
 
             if data.GetNumberOfPoints() == 0:
-                print("Warning: No data points found in file")
+                log.warning("No data points found in %s", file_path)
                 return False
 
             # Print available arrays for debugging
             point_data = data.GetPointData()
-            print(f"Available arrays: {[point_data.GetArrayName(i) for i in range(point_data.GetNumberOfArrays())]}")
-
-            # Clear previous actors
-            self.renderer.RemoveAllViewProps()
+            if log.isEnabledFor(logging.INFO):
+                log.info("Available arrays: %s",
+                         [point_data.GetArrayName(i) for i in range(point_data.GetNumberOfArrays())])
 
             # Set the active scalar field (like Java version)
             if selected_field and point_data.GetArray(selected_field):
                 point_data.SetActiveScalars(selected_field)
-                print(f"Set active scalar to: {selected_field}")
+                log.info("Set active scalar to: %s", selected_field)
             elif point_data.GetNumberOfArrays() > 0:
                 # Use the first available array
                 first_array_name = point_data.GetArrayName(0)
                 point_data.SetActiveScalars(first_array_name)
-                print(f"Set active scalar to first array: {first_array_name}")
-
-            # Force update the data
-            data.Modified()
-
-            # Use the same approach as Java version - simple DataSetMapper
-            mapper = vtk.vtkDataSetMapper()
-            mapper.SetInputData(data)
-
-            # Enable scalar visibility and set scalar mode (like Java version)
-            mapper.SetScalarVisibility(1)  # Use 1 instead of True for compatibility
-            mapper.SetScalarModeToUsePointData()
-            mapper.SetColorModeToMapScalars()
+                log.info("Set active scalar to first array: %s", first_array_name)
+
+            # Only the source output changes; the mappers, actors and legend are reused.
+            # A newly read dataset is newer than anything the mappers have built from
+            mapper = self.mapper
+            # Frames of a fixed grid only change their values, so the mapper can keep
+            # the uploaded geometry; any change of the grid turns that off again
+            static = self._same_geometry(data)
+            if static != self._static_enabled:
+                self._static_enabled = static
+                mapper.SetStatic(static)
+                if not static:
+                    mapper.Modified()
+            self._source.SetOutput(data)
+            is_image = data.IsA('vtkImageData') and data.GetDimensions()[2] == 1
+            if is_image and self.image_mapper.GetNumberOfInputConnections(0) == 0:
+                self.image_mapper.SetInputConnection(self._source.GetOutputPort())
+            # A hidden actor is not rendered, so its mapper does no work
+            self.actor.SetVisibility(not is_image)
+            self.image_actor.SetVisibility(is_image)
 
             # Set scalar range if data has scalars
+            scalar_range = None
             if point_data.GetNumberOfArrays() > 0:
                 active_array = point_data.GetScalars()
                 if active_array:
-                    scalar_range = active_array.GetRange()
-                    mapper.SetScalarRange(scalar_range)
-                    print(f"Scalar range: {scalar_range}")
-                    print(f"Active scalar array name: {active_array.GetName()}")
-                    print(f"Mapper scalar visibility: {mapper.GetScalarVisibility()}")
-                    print(f"Mapper scalar mode: {mapper.GetScalarMode()}")
+                    # Also sets the table range and the legend title
+                    scalar_range = self._fit_colors(active_array.GetName())
+                    log.info("Scalar range: %s", scalar_range)
+                    log.debug("Active scalar array name: %s", active_array.GetName())
+                    log.debug("Mapper scalar visibility: %s", mapper.GetScalarVisibility())
+                    log.debug("Mapper scalar mode: %s", mapper.GetScalarMode())
                 else:
-                    print("Warning: No active scalar array found!")
+                    log.warning("No active scalar array found in %s", file_path)
             else:
-                print("Warning: No point data arrays found!")
+                log.warning("No point data arrays found in %s", file_path)
 
-            # Create and configure lookup table (like Java version)
-            lut = vtk.vtkLookupTable()
-            lut.SetHueRange(0.667, 0.0)  # Blue to red
-            lut.SetSaturationRange(1.0, 1.0)
-            lut.SetValueRange(1.0, 1.0)
-            lut.SetNumberOfColors(256)
+            if scalar_range is None:
+                self.scalar_bar.SetTitle("Value")
 
-            # Set the table range to match the data range
-            if point_data.GetNumberOfArrays() > 0:
-                active_array = point_data.GetScalars()
-                if active_array:
-                    scalar_range = active_array.GetRange()
-                    lut.SetTableRange(scalar_range)
-                    print(f"Set lookup table range to: {scalar_range}")
-
-            lut.Build()
-
-            mapper.SetLookupTable(lut)
-            # Don't use SetUseLookupTableScalarRange, let mapper handle the range
-            # mapper.SetUseLookupTableScalarRange(1)
-
-            actor = vtk.vtkActor()
-            actor.SetMapper(mapper)
-
-            # Add to renderer
-            self.renderer.AddActor(actor)
-
-            # Add scalar bar for color legend (like Java version)
-            scalar_bar = vtk.vtkScalarBarActor()
-            scalar_bar.SetLookupTable(lut)
-            scalar_bar.SetTitle(selected_field if selected_field else "Value")
-            scalar_bar.SetNumberOfLabels(4)  # Use 4 like Java version
-            scalar_bar.SetPosition(0.85, 0.1)
-            scalar_bar.SetWidth(0.1)
-            scalar_bar.SetHeight(0.8)
-            self.renderer.AddActor2D(scalar_bar)
+            if not self.renderer.HasViewProp(self.actor):
+                # First load, or the scene was cleared (e.g. for generated test data)
+                self.renderer.RemoveAllViewProps()
+                self.renderer.AddActor(self.actor)
+                self.renderer.AddViewProp(self.image_actor)
+                self.renderer.AddViewProp(self.scalar_bar)
+                if self.edge_actor is not None:
+                    self.renderer.AddActor(self.edge_actor)
 
             # Set up proper camera for 2D data
             self.setup_optimal_camera(data)
@@ -172,36 +519,131 @@ class VTKVisualizationWidget(QWidget):
             # Set background color like Java version
             self.renderer.SetBackground(0.5, 0.5, 0.5)  # Gray background like Java
 
+            self._path = str(file_path)
+            self._mtime = mtime
+            self._data = data
+
             # Render
             self.render_window.Render()
 
-            print(f"Successfully loaded {file_path} with {data.GetNumberOfPoints()} points")
+            log.info("Successfully loaded %s with %d points", file_path, data.GetNumberOfPoints())
             return True
 
-        except Exception as e:
-            print(f"Error loading VTK file: {e}")
+        except Exception:
+            log.error("Error loading VTK file %s", file_path, exc_info=True)
             return False
             
+    def set_field(self, field):
+        """Color the loaded dataset by another point data array, re-reading it only if that array was skipped"""
+        if self._data is None or not field:
+            return
+        point_data = self._data.GetPointData()
+        active = point_data.GetScalars()
+        if not self._has_field(field):
+            # Only the shown field's array was read; the new one is shown once it is
+            self.reload_arrays_only(self._path, field)
+            return
+        if not point_data.GetArray(field) or (active and active.GetName() == field):
+            return
+        point_data.SetActiveScalars(field)
+        self._fit_colors(field)
+        
+    def _fit_colors(self, field):
+        """Fit the color range and legend to a point data array of the shown dataset; its (min, max)"""
+        scalar_range = self.scalar_range(field)
+        self.mapper.SetScalarRange(scalar_range)
+        self.lut.SetTableRange(scalar_range)
+        # The legend keeps its actor; an unchanged title does not mark it modified
+        self.scalar_bar.SetTitle(field)
+        return scalar_range
+        
+    def set_opacity(self, opacity):
+        """Set the dataset's opacity; shown on the next render"""
+        self._property.SetOpacity(opacity)
+        self._image_property.SetOpacity(opacity)
+        
+    def set_mesh_visible(self, visible):
+        """Show or hide the grid edges over the dataset; shown on the next render"""
+        if self.edge_actor is None:
+            if not visible or self._data is None:
+                return
+            # Built once on the dataset source, so later datasets reach it too
+            self._edges = vtk.vtkExtractEdges()
+            self._edges.SetInputConnection(self._source.GetOutputPort())
+            edge_mapper = vtk.vtkPolyDataMapper()
+            edge_mapper.SetInputConnection(self._edges.GetOutputPort())
+            edge_mapper.ScalarVisibilityOff()
+            self.edge_actor = vtk.vtkActor()
+            self.edge_actor.SetMapper(edge_mapper)
+            edge_property = self.edge_actor.GetProperty()
+            edge_property.SetRepresentationToWireframe()
+            edge_property.SetColor(0.0, 0.0, 0.0)
+            self.renderer.AddActor(self.edge_actor)
+        # Hidden actors are not rendered, so their edges are not extracted either
+        self.edge_actor.SetVisibility(bool(visible))
+        
+    def set_colormap(self, name):
+        """Color the dataset and its legend with a named colormap"""
+        lut = self._luts.get(name)
+        if lut is None:
+            lut = self._luts[name] = self._build_lookup_table(name)
+        if lut is self.lut:
+            return
+        lut.SetTableRange(self.mapper.GetScalarRange())
+        self.lut = lut
+        self.mapper.SetLookupTable(lut)
+        self._image_property.SetLookupTable(lut)
+        self.scalar_bar.SetLookupTable(lut)
+        
+    @staticmethod
+    def _build_lookup_table(name):
+        """256-entry lookup table sampled from a matplotlib colormap, or a hue ramp"""
+        lut = vtk.vtkLookupTable()
+        try:
+            from matplotlib import colormaps
+            cmap = colormaps[name]
+        except (ImportError, KeyError):
+            cmap = None
+        if cmap is None:
+            lut.SetNumberOfColors(256)
+            lut.SetHueRange(_COLORMAP_HUE_RANGES.get(name, _DEFAULT_HUE_RANGE))
+            lut.SetSaturationRange(1.0, 1.0)
+            lut.SetValueRange(1.0, 1.0)
+            lut.Build()
+        else:
+            # Handed over as one RGBA byte array instead of one call per entry
+            rgba = cmap(np.linspace(0.0, 1.0, 256), bytes=True)
+            lut.SetTable(numpy_to_vtk(rgba, deep=True, array_type=vtk.VTK_UNSIGNED_CHAR))
+        return lut
+        
+    def scalar_range(self, field):
+        """(min, max) of a point data array in the loaded dataset, or None"""
+        if self._wrapped is None:
+            return None
+        values = self._wrapped.PointData[field]
+        if values is dsa.NoneArray:
+            return None
+        if values.ndim > 1:
+            values = values[:, 0]  # first component, like vtkDataArray.GetRange()
+        # NaN is skipped, as VTK does
+        return float(np.nanmin(values)), float(np.nanmax(values))
+        
     def setup_optimal_camera(self, data):
         """Setup optimal camera view for the data"""
         try:
-            bounds = data.GetBounds()
-            dims = [data.GetDimensions()[i] for i in range(3)]  # Avoid deprecation warning
-
-            # Calculate data properties
-            x_range = bounds[1] - bounds[0]
-            y_range = bounds[3] - bounds[2]
-            z_range = bounds[5] - bounds[4]
+            bounds = np.asarray(data.GetBounds())
+            # Only grids have dimensions, filled into a given list as structured grids require
+            dims = [0, 0, 0]
+            if hasattr(data, 'GetDimensions'):
+                data.GetDimensions(dims)
 
-            center = [
-                (bounds[0] + bounds[1]) / 2,
-                (bounds[2] + bounds[3]) / 2,
-                (bounds[4] + bounds[5]) / 2
-            ]
+            # Calculate data properties from the (min, max) pairs of the bounds
+            x_range, y_range, z_range = (bounds[1::2] - bounds[::2]).tolist()
+            center = ((bounds[1::2] + bounds[::2]) / 2).tolist()
 
-            print(f"Data bounds: X[{bounds[0]:.3f}, {bounds[1]:.3f}], Y[{bounds[2]:.3f}, {bounds[3]:.3f}], Z[{bounds[4]:.3f}, {bounds[5]:.3f}]")
-            print(f"Data ranges: X={x_range:.3f}, Y={y_range:.3f}, Z={z_range:.3f}")
-            print(f"Data center: [{center[0]:.3f}, {center[1]:.3f}, {center[2]:.3f}]")
+            log.debug("Data bounds: X[%.3f, %.3f], Y[%.3f, %.3f], Z[%.3f, %.3f]", *bounds)
+            log.debug("Data ranges: X=%.3f, Y=%.3f, Z=%.3f", x_range, y_range, z_range)
+            log.debug("Data center: [%.3f, %.3f, %.3f]", *center)
 
             camera = self.camera
 
@@ -209,7 +651,7 @@ class VTKVisualizationWidget(QWidget):
             is_2d = dims[2] == 1 or z_range < 1e-6
 
             if is_2d:
-                print("Setting up 2D camera view")
+                log.debug("Setting up 2D camera view")
 
                 # For 2D data, position camera above looking down
                 max_range = max(x_range, y_range)
@@ -230,10 +672,10 @@ class VTKVisualizationWidget(QWidget):
                 parallel_scale = max_range * margin_factor / 2
                 camera.SetParallelScale(parallel_scale)
 
-                print(f"2D camera setup: position={camera_pos}, parallel_scale={parallel_scale:.3f}")
+                log.debug("2D camera setup: position=%s, parallel_scale=%.3f", camera_pos, parallel_scale)
 
             else:
-                print("Setting up 3D camera view")
+                log.debug("Setting up 3D camera view")
 
                 # For 3D data, use perspective projection and reset camera
                 camera.ParallelProjectionOff()
@@ -242,21 +684,29 @@ class VTKVisualizationWidget(QWidget):
                 # Adjust the camera to show all data with some margin
                 camera.Zoom(0.8)  # Zoom out a bit to add margin
 
-            print(f"Final camera: position={camera.GetPosition()}, focal_point={camera.GetFocalPoint()}")
-            print(f"Camera distance: {camera.GetDistance():.3f}")
-            if camera.GetParallelProjection():
-                print(f"Parallel scale: {camera.GetParallelScale():.3f}")
-            else:
-                print(f"View angle: {camera.GetViewAngle():.1f} degrees")
+            # The camera is only queried when the summary is logged
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Final camera: position=%s, focal_point=%s", camera.GetPosition(), camera.GetFocalPoint())
+                log.debug("Camera distance: %.3f", camera.GetDistance())
+                if camera.GetParallelProjection():
+                    log.debug("Parallel scale: %.3f", camera.GetParallelScale())
+                else:
+                    log.debug("View angle: %.1f degrees", camera.GetViewAngle())
 
         except Exception as e:
-            print(f"Error setting up camera: {e}")
+            log.warning("Could not set up camera, resetting it instead: %s", e)
             # Fallback to default
             self.renderer.ResetCamera()
 
+    def reset_scene(self):
+        """Remove all props and forget the loaded file, so the next load reads it again"""
+        self.renderer.RemoveAllViewProps()
+        self._path = None
+        self._data = None
+        
     def clear_visualization(self):
         """Clear the visualization"""
-        self.renderer.RemoveAllViewProps()
+        self.reset_scene()
         self.render_window.Render()
 
 
@@ -265,54 +715,93 @@ class ViewerSettings(QWidget):
     
     settings_changed = pyqtSignal()
     
+    DEFAULT_COLORMAP = 'viridis'
+    
     def __init__(self):
         super().__init__()
+        self._frame_range = (0, 0)  # (last frame, current frame) for the animation tab
+        
+        # Control changes are passed on once the pending events are processed, so a
+        # burst of them (e.g. dragging the opacity slider) is a single settings_changed
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self.settings_changed.emit)
+        
         self.init_ui()
         
+    def _schedule_emit(self, *args):
+        """Emit settings_changed once the current burst of control changes is over"""
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+            
     def init_ui(self):
         """Initialize the user interface"""
         self.setMaximumWidth(300)
         
         layout = QVBoxLayout(self)
         
-        # Create tabs
-        tab_widget = QTabWidget()
+        # Create tab placeholders; contents are built the first time a tab is shown
+        self.tab_widget = QTabWidget()
+        self._tab_builders = {}
+        tabs = (("Display", self.create_display_tab),
+                ("Colormap", self.create_colormap_tab),
+                ("Animation", self.create_animation_tab))
+        for index, (title, builder) in enumerate(tabs):
+            self.tab_widget.addTab(QWidget(), title)
+            self._tab_builders[index] = builder
+        self._ensure_tab_built(0)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         
-        # Display tab
-        display_tab = self.create_display_tab()
-        tab_widget.addTab(display_tab, "Display")
-        
-        # Colormap tab
-        colormap_tab = self.create_colormap_tab()
-        tab_widget.addTab(colormap_tab, "Colormap")
+        layout.addWidget(self.tab_widget)
+        layout.addStretch()
         
-        # Animation tab
-        animation_tab = self.create_animation_tab()
-        tab_widget.addTab(animation_tab, "Animation")
+    def _ensure_tab_built(self, index):
+        """Build a tab's contents on first use"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            builder(self.tab_widget.widget(index))
+            
+    def colormap(self):
+        """Selected colormap name, the default until the Colormap tab is built"""
+        if hasattr(self, 'colormap_combo'):
+            return self.colormap_combo.currentText()
+        return self.DEFAULT_COLORMAP
         
-        layout.addWidget(tab_widget)
-        layout.addStretch()
+    def set_frame_range(self, last, current):
+        """Set the selectable frames, applied to the Animation tab once it exists"""
+        self._frame_range = (last, current)
+        if hasattr(self, 'current_frame_spin'):
+            self._apply_frame_range()
+            
+    def _apply_frame_range(self):
+        last, current = self._frame_range
+        spin = self.current_frame_spin
+        # Set programmatically, so no valueChanged is passed on
+        spin.blockSignals(True)
+        spin.setMaximum(last)
+        spin.setValue(current)
+        spin.blockSignals(False)
         
-    def create_display_tab(self):
+    def create_display_tab(self, widget):
         """Create display settings tab"""
-        widget = QWidget()
         layout = QFormLayout(widget)
         
         # Field selection
         self.field_combo = QComboBox()
         self.field_combo.addItems(['phi', 'rho', 'nd.O+', 'efi', 'efj'])
-        self.field_combo.currentTextChanged.connect(self.settings_changed.emit)
+        self.field_combo.currentTextChanged.connect(self._schedule_emit)
         layout.addRow("Field:", self.field_combo)
         
         # Show mesh
         self.show_mesh_check = QCheckBox()
-        self.show_mesh_check.toggled.connect(self.settings_changed.emit)
+        self.show_mesh_check.toggled.connect(self._schedule_emit)
         layout.addRow("Show Mesh:", self.show_mesh_check)
         
         # Show boundaries
         self.show_boundaries_check = QCheckBox()
         self.show_boundaries_check.setChecked(True)
-        self.show_boundaries_check.toggled.connect(self.settings_changed.emit)
+        self.show_boundaries_check.toggled.connect(self._schedule_emit)
         layout.addRow("Show Boundaries:", self.show_boundaries_check)
         
         # Opacity
@@ -320,33 +809,31 @@ class ViewerSettings(QWidget):
         self.opacity_slider.setMinimum(0)
         self.opacity_slider.setMaximum(100)
         self.opacity_slider.setValue(100)
-        self.opacity_slider.valueChanged.connect(self.settings_changed.emit)
+        self.opacity_slider.valueChanged.connect(self._schedule_emit)
         layout.addRow("Opacity:", self.opacity_slider)
         
-        return widget
-        
-    def create_colormap_tab(self):
+    def create_colormap_tab(self, widget):
         """Create colormap settings tab"""
-        widget = QWidget()
         layout = QFormLayout(widget)
         
         # Colormap selection
         self.colormap_combo = QComboBox()
         self.colormap_combo.addItems(['viridis', 'plasma', 'inferno', 'magma', 'jet', 'rainbow'])
-        self.colormap_combo.currentTextChanged.connect(self.settings_changed.emit)
+        self.colormap_combo.setCurrentText(self.DEFAULT_COLORMAP)
+        self.colormap_combo.currentTextChanged.connect(self._schedule_emit)
         layout.addRow("Colormap:", self.colormap_combo)
         
         # Auto range
         self.auto_range_check = QCheckBox()
         self.auto_range_check.setChecked(True)
-        self.auto_range_check.toggled.connect(self.settings_changed.emit)
+        self.auto_range_check.toggled.connect(self._schedule_emit)
         layout.addRow("Auto Range:", self.auto_range_check)
         
         # Min value
         self.min_value_spin = QDoubleSpinBox()
         self.min_value_spin.setMinimum(-1e10)
         self.min_value_spin.setMaximum(1e10)
-        self.min_value_spin.valueChanged.connect(self.settings_changed.emit)
+        self.min_value_spin.valueChanged.connect(self._schedule_emit)
         layout.addRow("Min Value:", self.min_value_spin)
         
         # Max value
@@ -354,14 +841,11 @@ class ViewerSettings(QWidget):
         self.max_value_spin.setMinimum(-1e10)
         self.max_value_spin.setMaximum(1e10)
         self.max_value_spin.setValue(1.0)
-        self.max_value_spin.valueChanged.connect(self.settings_changed.emit)
+        self.max_value_spin.valueChanged.connect(self._schedule_emit)
         layout.addRow("Max Value:", self.max_value_spin)
         
-        return widget
-        
-    def create_animation_tab(self):
+    def create_animation_tab(self, widget):
         """Create animation settings tab"""
-        widget = QWidget()
         layout = QFormLayout(widget)
         
         # Animation controls
@@ -386,10 +870,8 @@ class ViewerSettings(QWidget):
         # Current frame
         self.current_frame_spin = QSpinBox()
         self.current_frame_spin.setMinimum(0)
-        self.current_frame_spin.setMaximum(1000)
+        self._apply_frame_range()
         layout.addRow("Current Frame:", self.current_frame_spin)
-        
-        return widget
 
 
 class SimulationResultViewer(QWidget):
@@ -399,7 +881,18 @@ class SimulationResultViewer(QWidget):
         super().__init__()
         self.simulation_runner = simulation_runner
         self.current_file = None
-        self.auto_refresh_timer = QTimer()
+        
+        # Auto refresh follows change notifications for the shown file instead of
+        # polling it; signals are blocked while auto refresh is off
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.blockSignals(True)
+        # A file is often written in several steps, so it is re-read once they settle
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(200)
+        self._refresh_timer.timeout.connect(self.refresh_view)
+        
+        self._last_settings = None  # settings shown, None when they must all be applied
         
         self.init_ui()
         self.setup_connections()
@@ -467,7 +960,9 @@ class SimulationResultViewer(QWidget):
     def setup_connections(self):
         """Setup signal-slot connections"""
         self.settings_widget.settings_changed.connect(self.on_settings_changed)
-        self.auto_refresh_timer.timeout.connect(self.refresh_view)
+        self.vtk_widget.dataset_loaded.connect(self._on_dataset_loaded)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
         
     def load_file(self):
         """Load a result file"""
@@ -478,7 +973,6 @@ class SimulationResultViewer(QWidget):
 
         if file_path:
             self.load_and_update_everything(file_path)
-            self.setWindowTitle(f"Result Viewer - {Path(file_path).name}")
                 
     def show_current_simulation(self):
         """Show results from the currently running simulation"""
@@ -490,9 +984,16 @@ class SimulationResultViewer(QWidget):
         # Try to find the most recent output files from the simulation
         try:
             output_files = self.find_simulation_output_files()
+            # Files written later are picked up from the directory notifications
+            watched_dirs = self._watcher.directories()
+            if watched_dirs:
+                self._watcher.removePaths(watched_dirs)
+            output_dirs = [str(d) for d in self._simulation_output_dirs()]
+            if output_dirs:
+                self._watcher.addPaths(output_dirs)
             if output_files:
                 # Load the most recent file
-                latest_file = max(output_files, key=lambda f: f.stat().st_mtime)
+                latest_file = output_files[-1]
                 self.load_and_update_everything(str(latest_file))
 
                 # Enable auto-refresh if not already enabled
@@ -511,97 +1012,149 @@ class SimulationResultViewer(QWidget):
             QMessageBox.warning(self, "Error",
                                 f"Failed to load simulation output: {str(e)}")
 
+    def _simulation_output_dirs(self):
+        """Existing directories the current simulation may write VTS files to"""
+        # Get the current simulation's working directory
+        if not (hasattr(self.simulation_runner, 'current_worker') and self.simulation_runner.current_worker):
+            return []
+        # Get the directory where the simulation is running
+        sim_file = self.simulation_runner.current_worker.simulation_file
+        sim_dir = sim_file.parent
+
+        # Look for VTS files in common output directories
+        search_dirs = [
+            sim_dir,
+            sim_dir / "results",
+            sim_dir / "output",
+            sim_dir / "vtk"
+        ]
+        return [search_dir for search_dir in search_dirs if search_dir.exists()]
+
     def find_simulation_output_files(self):
-        """Find VTS files from the current simulation"""
+        """Find VTS files from the current simulation, oldest first"""
         output_files = []
 
-        # Get the current simulation's working directory
-        if hasattr(self.simulation_runner, 'current_worker') and self.simulation_runner.current_worker:
-            # Get the directory where the simulation is running
-            sim_file = self.simulation_runner.current_worker.simulation_file
-            sim_dir = sim_file.parent
-
-            # Look for VTS files in common output directories
-            search_dirs = [
-                sim_dir,
-                sim_dir / "results",
-                sim_dir / "output",
-                sim_dir / "vtk"
-            ]
-
-            for search_dir in search_dirs:
-                if search_dir.exists():
-                    # Find all VTS files
-                    vts_files = list(search_dir.glob("*.vts"))
-                    output_files.extend(vts_files)
-
-                    # Also look for numbered VTS files (animation frames)
-                    numbered_vts = list(search_dir.glob("*_[0-9]*.vts"))
-                    output_files.extend(numbered_vts)
-
-        return output_files
-
-    def load_and_update_everything(self, file_path):
-        """Load a VTS file and update the visualization"""
-        try:
-            # Store the current file (ensure it's a string)
-            self.current_file = str(file_path)
+        for search_dir in self._simulation_output_dirs():
+            # All VTS files, numbered animation frames included, with their mtimes
+            try:
+                output_files.extend(_vts_files(search_dir))
+            except OSError:
+                continue
+
+        output_files.sort(key=lambda f: f[1])
+        return [Path(path) for path, _ in output_files]
 
-            # Update the settings based on the loaded file first
-            self.update_field_choices()
+    def load_and_update_everything(self, file_path, silent=False):
+        """Load a VTS file and update the visualization; a silent load skips title and dialogs"""
+        try:
+            # Store the current file (ensure it's a string); the title follows
+            # the file, so it only changes when another file is shown
+            file_path = str(file_path)
+            if file_path != self.current_file:
+                if self.current_file:
+                    self._watcher.removePath(self.current_file)
+                self.current_file = file_path
+                self._watcher.addPath(file_path)
+                if not silent:
+                    self.setWindowTitle(f"Result Viewer - {Path(file_path).name}")
 
             # Get the selected field
             selected_field = self.settings_widget.field_combo.currentText()
 
-            # Load the file into VTK with the selected field
-            self.vtk_widget.load_vts_file(self.current_file, selected_field)
-
-            # Apply current settings
-            self.on_settings_changed()
+            # Read the file on the thread pool; the field choices and current
+            # settings are applied in _on_dataset_loaded once it is shown
+            self.vtk_widget.load_vts_file_async(self.current_file, selected_field)
 
         except Exception as e:
-            QMessageBox.warning(self, "Load Error",
-                                f"Failed to load file {file_path}:\n{str(e)}")
+            if silent:
+                log.warning("Failed to load file %s: %s", file_path, e)
+            else:
+                QMessageBox.warning(self, "Load Error",
+                                    f"Failed to load file {file_path}:\n{str(e)}")
+
+    def _on_dataset_loaded(self, file_path):
+        """Update the settings panel and apply the settings to a newly shown file"""
+        if file_path != self.current_file:
+            return
+        self.update_field_choices()
+        self.update_frame_range()
+        self._last_settings = None
+        self._apply_settings_now()
+
+    def update_frame_range(self):
+        """Limit the frame selector to the frames of the current file's series"""
+        frames = _series_files(self.current_file)
+        try:
+            index = frames.index(Path(self.current_file))
+        except ValueError:
+            index = 0
+        self.settings_widget.set_frame_range(max(len(frames) - 1, 0), index)
 
     def update_field_choices(self):
         """Update the field choices in the settings panel based on loaded data"""
         try:
-            # Get available fields from the VTK data
-            if hasattr(self.vtk_widget, 'reader') and self.vtk_widget.reader:
-                reader = self.vtk_widget.reader
-                reader.Update()
-
-                # Get point data arrays
-                point_data = reader.GetOutput().GetPointData()
-                num_arrays = point_data.GetNumberOfArrays()
-
-                field_names = []
-                for i in range(num_arrays):
-                    array_name = point_data.GetArrayName(i)
-                    if array_name:
-                        field_names.append(array_name)
-
-                # Update the field combo box
-                current_field = self.settings_widget.field_combo.currentText()
-                self.settings_widget.field_combo.clear()
-                self.settings_widget.field_combo.addItems(field_names)
+            # Get available fields from the shown file; only the displayed one has been read
+            field_names = [name for name in self.vtk_widget.field_names if name]
+            if field_names:
+
+                # Frames of a series share their fields, so the list is usually unchanged
+                field_combo = self.settings_widget.field_combo
+                if [field_combo.itemText(i) for i in range(field_combo.count())] == field_names:
+                    return
+
+                # Update the field combo box; the caller applies the settings
+                # afterwards, so the intermediate states are not signalled
+                current_field = field_combo.currentText()
+                field_combo.blockSignals(True)
+                field_combo.clear()
+                field_combo.addItems(field_names)
 
                 # Try to restore the previous selection
                 if current_field in field_names:
-                    self.settings_widget.field_combo.setCurrentText(current_field)
+                    field_combo.setCurrentText(current_field)
                 elif field_names:
-                    self.settings_widget.field_combo.setCurrentIndex(0)
+                    field_combo.setCurrentIndex(0)
+                field_combo.blockSignals(False)
 
         except Exception as e:
-            print(f"Warning: Could not update field choices: {e}")
+            log.warning("Could not update field choices: %s", e)
 
     def toggle_auto_refresh(self, enabled):
         """Toggle auto refresh"""
+        self._watcher.blockSignals(not enabled)
         if enabled:
-            self.auto_refresh_timer.start(2000)  # Refresh every 2 seconds
+            # Pick up changes made while it was off
+            self.refresh_view()
         else:
-            self.auto_refresh_timer.stop()
+            self._refresh_timer.stop()
             
+    def _on_file_changed(self, path):
+        """Schedule a refresh of the watched file"""
+        if path != self.current_file:
+            return
+        # Writers that replace the file drop it from the watch list, so watch it again
+        if path not in self._watcher.files() and os.path.exists(path):
+            self._watcher.addPath(path)
+        self._refresh_timer.start()
+        
+    def _on_directory_changed(self, path):
+        """Show the newest VTS file of a watched output directory if it is newer than the shown one"""
+        try:
+            files = _vts_files(path)
+        except OSError:
+            return
+        if not files:
+            return
+        newest, newest_mtime = max(files, key=lambda f: f[1])
+        if newest == self.current_file:
+            return
+        try:
+            if self.current_file and os.path.getmtime(self.current_file) >= newest_mtime:
+                return
+        except OSError:
+            pass
+        self.load_and_update_everything(newest, silent=True)
+        
     def refresh_view(self):
         """Refresh the current view"""
         if self.current_file:
@@ -609,125 +1162,114 @@ class SimulationResultViewer(QWidget):
             if current_path.exists():
                 # Get the currently selected field
                 selected_field = self.settings_widget.field_combo.currentText()
-                self.vtk_widget.load_vts_file(str(current_path), selected_field)
+                # Re-read only if the file changed; the display settings are
+                # restored in _on_dataset_loaded
+                if self.vtk_widget.needs_reload(current_path):
+                    self.vtk_widget.reload_arrays_only(str(current_path), selected_field)
             
     def on_settings_changed(self):
-        """Handle settings changes"""
+        """Handle settings changes; the panel coalesces bursts into one signal"""
+        self._apply_settings_now()
+            
+    def _apply_settings_now(self):
+        """Apply the current settings to the visualization"""
         if not self.current_file:
             return
 
         # Get current settings
-        field = self.settings_widget.field_combo.currentText()
-        show_mesh = self.settings_widget.show_mesh_check.isChecked()
-        show_boundaries = self.settings_widget.show_boundaries_check.isChecked()
-        opacity = self.settings_widget.opacity_slider.value() / 100.0
-        colormap = self.settings_widget.colormap_combo.currentText()
+        settings = {
+            'field': self.settings_widget.field_combo.currentText(),
+            'show_mesh': self.settings_widget.show_mesh_check.isChecked(),
+            'opacity': self.settings_widget.opacity_slider.value() / 100.0,
+            'colormap': self.settings_widget.colormap(),
+        }
 
         # Apply settings to visualization
         try:
-            # Reload the file with the selected field
-            self.vtk_widget.load_vts_file(self.current_file, field)
-
-            # Apply opacity
-            actors = self.vtk_widget.renderer.GetActors()
-            actors.InitTraversal()
-            actor = actors.GetNextItem()
-            while actor:
-                if hasattr(actor, 'GetProperty'):  # Check if it's a 3D actor
-                    actor.GetProperty().SetOpacity(opacity)
-                actor = actors.GetNextItem()
+            # Load the file if needed; a newly read file gets all settings
+            last = self._last_settings
+            if self.vtk_widget.ensure_loaded(self.current_file, settings['field']):
+                last = None
+            if settings == last:
+                return  # e.g. the field list was refilled with the same fields
+            changed = [key for key in settings if last is None or settings[key] != last[key]]
+
+            # Switch the displayed field
+            if 'field' in changed:
+                self.vtk_widget.set_field(settings['field'])
+
+            # Apply opacity; the file is shown by the widget's one dataset actor
+            if 'opacity' in changed:
+                self.vtk_widget.set_opacity(settings['opacity'])
+
+            # Overlay the grid edges
+            if 'show_mesh' in changed:
+                self.vtk_widget.set_mesh_visible(settings['show_mesh'])
 
             # Apply colormap
-            self.apply_colormap(colormap)
+            if 'colormap' in changed:
+                self.apply_colormap(settings['colormap'])
+
+            self._last_settings = settings
 
             # Render with new settings
             self.vtk_widget.render_window.Render()
 
-        except Exception as e:
-            print(f"Error applying settings: {e}")
+        except Exception:
+            log.error("Error applying settings", exc_info=True)
 
     def apply_colormap(self, colormap_name):
         """Apply the selected colormap"""
         try:
-            # Get the mapper from the current actor
-            actors = self.vtk_widget.renderer.GetActors()
-            actors.InitTraversal()
-            actor = actors.GetNextItem()
-
-            if actor and hasattr(actor, 'GetMapper'):
-                mapper = actor.GetMapper()
-                if mapper:
-                    # Create lookup table based on colormap selection
-                    lut = vtk.vtkLookupTable()
-                    lut.SetNumberOfColors(256)
-
-                    if colormap_name == 'viridis':
-                        lut.SetHueRange(0.667, 0.0)  # Blue to red
-                    elif colormap_name == 'plasma':
-                        lut.SetHueRange(0.8, 0.0)   # Purple to yellow
-                    elif colormap_name == 'jet':
-                        lut.SetHueRange(0.667, 0.0) # Blue to red (classic jet)
-                    elif colormap_name == 'rainbow':
-                        lut.SetHueRange(0.0, 0.667) # Red to blue
-                    else:  # Default to viridis
-                        lut.SetHueRange(0.667, 0.0)
-
-                    lut.SetSaturationRange(1.0, 1.0)
-                    lut.SetValueRange(1.0, 1.0)
-                    lut.Build()
-
-                    mapper.SetLookupTable(lut)
+            # Lookup tables are built once per colormap and reused
+            self.vtk_widget.set_colormap(colormap_name)
 
-        except Exception as e:
-            print(f"Error applying colormap: {e}")
+        except Exception:
+            log.error("Error applying colormap %s", colormap_name, exc_info=True)
 
     def generate_test_data(self):
         """Generate test VTK data for demonstration"""
         try:
-            # Create a simple structured grid with test data
-            grid = vtk.vtkStructuredGrid()
-
-            # Create points
-            points = vtk.vtkPoints()
+            # Create a simple regular grid with test data; the points are
+            # implied by origin and spacing, so no coordinates are stored
             nx, ny, nz = 20, 20, 1
-
-            for k in range(nz):
-                for j in range(ny):
-                    for i in range(nx):
-                        x = i * 0.1
-                        y = j * 0.1
-                        z = k * 0.1
-                        points.InsertNextPoint(x, y, z)
-
+            grid = vtk.vtkImageData()
             grid.SetDimensions(nx, ny, nz)
-            grid.SetPoints(points)
+            grid.SetOrigin(0.0, 0.0, 0.0)
+            grid.SetSpacing(0.1, 0.1, 0.1)
+
+            # Lattice coordinates as a row and a column that broadcast to the (z, y, x)
+            # grid, x varying fastest as VTK orders structured points. Everything is
+            # computed in float32, the type of the VTK arrays below
+            x = np.arange(nx, dtype=np.float32) * np.float32(0.1)
+            y = (np.arange(ny, dtype=np.float32) * np.float32(0.1))[:, np.newaxis]
+
+            # Contiguous float32 buffers that the VTK arrays below use in place. The
+            # fields do not depend on z, so each is computed on the xy plane and the
+            # last step broadcasts it into every layer of its buffer, with no copies
+            phi = np.empty((nz, ny, nx), dtype=np.float32)
+            rho = np.empty_like(phi)
+            # Potential: simple quadratic
+            np.multiply(x*x + y*y, -10, out=phi)
+            # Density: Gaussian distribution
+            np.multiply(np.exp(((x-1.0)**2 + (y-1.0)**2) / -0.2), 1e12, out=rho)
+            phi = phi.ravel()
+            rho = rho.ravel()
+
+            # VTK does not own these buffers (save=1), so keep them alive on the viewer
+            self._test_data_buffers = (phi, rho)
 
             # Create scalar data (potential field)
             phi_array = vtk.vtkFloatArray()
-            phi_array.SetName("phi")
             phi_array.SetNumberOfComponents(1)
+            phi_array.SetArray(phi, phi.size, 1)
+            phi_array.SetName("phi")
 
             # Create density data
             rho_array = vtk.vtkFloatArray()
-            rho_array.SetName("rho")
             rho_array.SetNumberOfComponents(1)
-
-            # Generate test data
-            import math
-            for k in range(nz):
-                for j in range(ny):
-                    for i in range(nx):
-                        x = i * 0.1
-                        y = j * 0.1
-
-                        # Potential: simple quadratic
-                        phi = -(x*x + y*y) * 10
-                        phi_array.InsertNextValue(phi)
-
-                        # Density: Gaussian distribution
-                        r2 = (x-1.0)**2 + (y-1.0)**2
-                        rho = math.exp(-r2/0.2) * 1e12
-                        rho_array.InsertNextValue(rho)
+            rho_array.SetArray(rho, rho.size, 1)
+            rho_array.SetName("rho")
 
             # Add arrays to grid
             grid.GetPointData().AddArray(phi_array)
@@ -735,7 +1277,7 @@ class SimulationResultViewer(QWidget):
             grid.GetPointData().SetActiveScalars("phi")
 
             # Clear previous actors
-            self.vtk_widget.renderer.RemoveAllViewProps()
+            self.vtk_widget.reset_scene()
 
             # Create mapper and actor
             mapper = vtk.vtkDataSetMapper()
@@ -759,4 +1301,4 @@ class SimulationResultViewer(QWidget):
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to generate test data: {e}")
-            print(f"Error generating test data: {e}")
+            log.error("Error generating test data", exc_info=True)
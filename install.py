@@ -4,12 +4,50 @@ Installation script for Starfish Python GUI
 This script helps set up the environment and dependencies
 """
 
+import io
 import sys
+import compileall
 import subprocess
 import os
+import re
+import time
+import shutil
+import threading
+import argparse
+import hashlib
+import importlib.util
+import importlib.metadata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import platform
 
+try:
+    from packaging.requirements import Requirement, InvalidRequirement
+except ImportError:
+    Requirement = None  # installed packages are then accepted at any version
+
+# Folder of this script, resolved once (the project root)
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# Markers that let a rerun skip work when nothing changed
+CACHE_DIR = Path.home() / ".cache" / "starfish"
+# Installed packages belong to one interpreter, so each environment has its own markers
+ENV_CACHE_DIR = CACHE_DIR / hashlib.sha256(f"{sys.prefix}\n{sys.executable}".encode()).hexdigest()[:16]
+REQUIREMENTS_MARKER = ENV_CACHE_DIR / "requirements.sha256"
+PIP_UPGRADE_MARKER = ENV_CACHE_DIR / "pip-upgraded"
+PIP_UPGRADE_INTERVAL = 7 * 24 * 3600  # upgrade pip at most once a week
+JAR_MARKER = CACHE_DIR / "starfish-jar"
+SHORTCUT_MARKER = CACHE_DIR / "desktop-shortcut"
+
+# Where to look for the Starfish jar, relative to the working directory
+JAR_DIRS = ("", "build", "dist", "target")
+CLI_JAR = "StarfishCLI.jar"
+GUI_JAR = "Starfish.jar"  # Full GUI version, used if there is no CLI jar
+
+# Non-interactive pip that takes wheels over source distributions
+PIP_INSTALL = [sys.executable, '-m', 'pip', 'install', '--prefer-binary', '--no-input',
+               '--disable-pip-version-check']
+
 def check_python_version():
     """Check if Python version is compatible"""
     print("Checking Python version...")
@@ -23,45 +61,145 @@ def check_python_version():
     print(f"✅ Python {version.major}.{version.minor}.{version.micro} is compatible")
     return True
 
-def check_java():
+def check_java(verify=False):
     """Check if Java is available"""
     print("\nChecking Java installation...")
     
+    java = shutil.which('java')
+    if java is None:
+        print("❌ Java not found in PATH")
+        print("   Please install Java Runtime Environment (JRE) 8 or higher")
+        return False
+    if not verify:
+        # Starting a JVM just for its version takes a noticeable fraction of a second
+        print(f"✅ Java found: {java}")
+        return True
+    
     try:
-        result = subprocess.run(['java', '-version'], 
-                              capture_output=True, text=True)
+        result = subprocess.run([java, '-version'], stdin=subprocess.DEVNULL,
+                              capture_output=True)
         if result.returncode == 0:
-            # Java version is in stderr for some reason
-            version_info = result.stderr.split('\n')[0]
+            # Java version is in stderr for some reason; only its first line is decoded
+            version_info = result.stderr.split(b'\n', 1)[0].decode('utf-8', 'replace').rstrip()
             print(f"✅ Java found: {version_info}")
             return True
         else:
             print("❌ Java not found or not working")
             return False
-    except FileNotFoundError:
-        print("❌ Java not found in PATH")
-        print("   Please install Java Runtime Environment (JRE) 8 or higher")
+    except OSError as e:
+        print(f"❌ Java could not be started: {e}")
         return False
 
-def install_dependencies():
+def requirement_lines(requirements_file):
+    """Requirement specifiers in a requirements file, without comments and pip options"""
+    lines = []
+    for line in requirements_file.read_text().splitlines():
+        line = line.split('#', 1)[0].strip()
+        if line and not line.startswith('-'):
+            lines.append(line)
+    return lines
+
+def requirement_name(line):
+    """Package name of a requirement specifier"""
+    return re.split(r'[\s<>=!~;\[]', line, 1)[0]
+
+def requirements_satisfied(requirements_file):
+    """True if every requirement is installed at a version it accepts"""
+    for line in requirement_lines(requirements_file):
+        try:
+            requirement = Requirement(line) if Requirement is not None else None
+        except InvalidRequirement:
+            return False  # e.g. a URL or VCS requirement; leave it to pip
+        if requirement is not None and requirement.marker and not requirement.marker.evaluate():
+            continue  # not needed on this platform
+        try:
+            installed = importlib.metadata.version(requirement_name(line))
+        except importlib.metadata.PackageNotFoundError:
+            return False
+        if requirement is not None and not requirement.specifier.contains(installed, prereleases=True):
+            return False
+    return True
+
+def pip_environment():
+    """Environment for pip runs; pip 24 and later fetch several downloads at once"""
+    env = dict(os.environ)
+    try:
+        pip_major = int(importlib.metadata.version('pip').split('.')[0])
+    except (importlib.metadata.PackageNotFoundError, ValueError):
+        pip_major = 0
+    if pip_major >= 24:
+        env.setdefault('PIP_PARALLEL_DOWNLOADS', '5')
+    return env
+
+def write_marker(marker, text=""):
+    """Record a completed step; a marker that cannot be written only costs a rerun"""
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.write_text(text)
+    except OSError:
+        pass
+
+def install_dependencies(force=False, offline=False):
     """Install Python dependencies"""
     print("\nInstalling Python dependencies...")
     
-    requirements_file = Path(__file__).parent / "requirements.txt"
+    requirements_file = PROJECT_ROOT / "requirements.txt"
     if not requirements_file.exists():
         print("❌ requirements.txt not found")
         return False
     
+    # Without network access, pip is only worth running if something is missing
+    if offline and not force and requirements_satisfied(requirements_file):
+        print("✅ All dependencies satisfied, skipping pip")
+        return True
+    
+    # The pinned lock file, if there is one, needs no dependency resolution
+    lock_file = PROJECT_ROOT / "requirements.lock"
+    install_file = lock_file if lock_file.exists() else requirements_file
+    
+    # Skip pip if these requirements were installed before and are still met
+    requirements_hash = hashlib.sha256(install_file.read_bytes()).hexdigest()
+    if not force:
+        try:
+            installed_hash = REQUIREMENTS_MARKER.read_text().strip()
+        except OSError:
+            installed_hash = None
+        if installed_hash == requirements_hash and requirements_satisfied(requirements_file):
+            print("✅ Dependencies unchanged since the last install")
+            return True
+    
     try:
-        # Upgrade pip first
-        print("Upgrading pip...")
-        subprocess.run([sys.executable, '-m', 'pip', 'install', '--upgrade', 'pip'], 
-                      check=True)
+        # pip is upgraded in the same run as the requirements, unless that was done recently
+        try:
+            pip_upgraded = time.time() - PIP_UPGRADE_MARKER.stat().st_mtime < PIP_UPGRADE_INTERVAL
+        except OSError:
+            pip_upgraded = False
+        requirements = ['-r', str(install_file)]
+        upgrade_pip = install_file is requirements_file and (force or not pip_upgraded)
+        if install_file is lock_file:
+            # Every package must then be pinned with a hash, so pip is not upgraded alongside
+            requirements = ['--require-hashes'] + requirements
+        elif upgrade_pip:
+            requirements = ['--upgrade', 'pip'] + requirements
         
         # Install requirements
-        print("Installing dependencies from requirements.txt...")
-        subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', str(requirements_file)], 
-                      check=True)
+        # Wheels only, so a resolver hiccup cannot start a long VTK or Qt source build
+        print(f"Installing dependencies from {install_file.name}...")
+        env = pip_environment()
+        # pip never reads stdin (--no-input), so it is not handed the terminal either
+        result = subprocess.run(PIP_INSTALL + ['--only-binary=:all:'] + requirements,
+                                stdin=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+                                close_fds=True, env=env)
+        if result.returncode != 0:
+            sys.stderr.write(result.stderr)
+            missing = re.findall(r"satisfies the requirement (\S+)", result.stderr)
+            print(f"⚠️  No binary wheel for {', '.join(missing) or 'some requirements'}, "
+                  "retrying with source builds allowed...")
+            subprocess.run(PIP_INSTALL + requirements, check=True, stdin=subprocess.DEVNULL,
+                           close_fds=True, env=env)
+        if upgrade_pip:
+            write_marker(PIP_UPGRADE_MARKER)
+        write_marker(REQUIREMENTS_MARKER, requirements_hash)
         
         print("✅ Dependencies installed successfully")
         return True
@@ -69,7 +207,47 @@ def install_dependencies():
         print(f"❌ Failed to install dependencies: {e}")
         return False
 
-def test_vtk_installation():
+def regenerate_lock():
+    """Pin requirements.txt, with hashes, into requirements.lock using pip-tools"""
+    print("\nRegenerating requirements.lock...")
+    
+    if importlib.util.find_spec('piptools') is None:
+        print("❌ pip-tools is not installed (pip install pip-tools)")
+        return False
+    
+    # --allow-unsafe also pins setuptools and pip, which --require-hashes needs
+    result = subprocess.run([sys.executable, '-m', 'piptools', 'compile', '--quiet',
+                             '--generate-hashes', '--allow-unsafe',
+                             '--output-file', str(PROJECT_ROOT / "requirements.lock"),
+                             str(PROJECT_ROOT / "requirements.txt")],
+                            stdin=subprocess.DEVNULL)
+    if result.returncode != 0:
+        print("❌ Could not resolve requirements.txt")
+        return False
+    
+    print("✅ requirements.lock written")
+    return True
+
+def is_headless():
+    """True on CI runners and on Linux without a display"""
+    if os.environ.get('CI'):
+        return True
+    return (platform.system() == "Linux" and
+            not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY'))
+
+def precompile_project():
+    """Compile the project's modules now, so the first start does not have to"""
+    print("\nCompiling Python modules...")
+    # Only the project's packages, not a local virtualenv or data folders in the
+    # checkout; modules with up-to-date bytecode are skipped, workers=0 uses every core
+    compiled = all([compileall.compile_dir(str(PROJECT_ROOT / package), quiet=1, workers=0)
+                    for package in ("core", "gui")])
+    if compileall.compile_file(str(PROJECT_ROOT / "main.py"), quiet=1) and compiled:
+        print("✅ Modules compiled")
+    else:
+        print("⚠️  Some modules could not be compiled")
+
+def test_vtk_installation(deep_check=False):
     """Test VTK installation"""
     print("\nTesting VTK installation...")
     
@@ -77,6 +255,11 @@ def test_vtk_installation():
         import vtk
         print(f"✅ VTK {vtk.vtkVersion.GetVTKVersion()} imported successfully")
         
+        # Setting up OpenGL is slow on a headless machine, and can hang with broken drivers
+        if is_headless() and not deep_check:
+            print("   Headless environment, skipping the rendering test (use --deep-check to run it)")
+            return True
+        
         # Test VTK rendering capability
         render_window = vtk.vtkRenderWindow()
         render_window.SetOffScreenRendering(1)  # Don't show window
@@ -102,10 +285,22 @@ def test_vtk_installation():
         print(f"❌ VTK test failed: {e}")
         return False
 
-def test_pyqt_installation():
+def test_pyqt_installation(deep_check=False):
     """Test PyQt5 installation"""
     print("\nTesting PyQt5 installation...")
     
+    # Creating an application loads the Qt platform plugins, which is slow; finding
+    # the modules is enough unless asked for more, or they are missing
+    if not deep_check:
+        try:
+            found = (importlib.util.find_spec("PyQt5.QtWidgets") is not None and
+                     importlib.util.find_spec("PyQt5.QtCore") is not None)
+        except ImportError:
+            found = False
+        if found:
+            print("✅ PyQt5 found (use --deep-check to create a test application)")
+            return True
+    
     try:
         from PyQt5.QtWidgets import QApplication
         from PyQt5.QtCore import Qt
@@ -123,31 +318,56 @@ def test_pyqt_installation():
         print(f"❌ PyQt5 test failed: {e}")
         return False
 
+def list_jars(directory):
+    """Starfish jars in a directory, by name"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: Path(entry.path) for entry in entries
+                    if entry.name in (CLI_JAR, GUI_JAR)}
+    except OSError:
+        return {}  # e.g. no such folder
+
+def scan_for_jar(current_dir):
+    """Starfish jar in a directory or its build output folders, or None"""
+    # Listed concurrently, as each listing can be slow on a network file system
+    with ThreadPoolExecutor(max_workers=len(JAR_DIRS)) as executor:
+        listings = list(executor.map(list_jars, [current_dir / sub_dir for sub_dir in JAR_DIRS]))
+    for name in (CLI_JAR, GUI_JAR):
+        for jars in listings:
+            if name in jars:
+                return jars[name]
+    return None
+
+def cached_jar(current_dir):
+    """Jar found by the last run in this directory, if it is unchanged"""
+    try:
+        cached_dir, jar_path, size, mtime = JAR_MARKER.read_text().split('\n')
+        stat = os.stat(jar_path)
+        if cached_dir == str(current_dir) and (stat.st_size, stat.st_mtime_ns) == (int(size), int(mtime)):
+            return Path(jar_path)
+    except (OSError, ValueError):
+        pass
+    return None
+
 def find_starfish_jar():
     """Find Starfish CLI jar file"""
     print("\nLooking for Starfish CLI jar file...")
     
     current_dir = Path.cwd()
-    possible_locations = [
-        current_dir / "StarfishCLI.jar",
-        current_dir / "build" / "StarfishCLI.jar",
-        current_dir / "dist" / "StarfishCLI.jar",
-        current_dir / "target" / "StarfishCLI.jar",
-        current_dir / "Starfish.jar"  # Full GUI version
-    ]
-    
-    found_jars = []
-    for jar_path in possible_locations:
-        if jar_path.exists():
-            found_jars.append(jar_path)
-            print(f"✅ Found: {jar_path}")
-    
-    if not found_jars:
+    jar_path = cached_jar(current_dir)
+    if jar_path is None:
+        jar_path = scan_for_jar(current_dir)
+        if jar_path is not None:
+            stat = jar_path.stat()
+            write_marker(JAR_MARKER, f"{current_dir}\n{jar_path}\n{stat.st_size}\n{stat.st_mtime_ns}")
+    
+    if jar_path is None:
         print("⚠️  No Starfish jar files found")
         print("   You'll need to download StarfishCLI.jar from:")
         print("   https://github.com/particleincell/Starfish/releases")
         return False
     
+    print(f"✅ Found: {jar_path}")
     return True
 
 def create_desktop_shortcut():
@@ -157,6 +377,17 @@ def create_desktop_shortcut():
     
     print("\nCreating desktop shortcut...")
     
+    # A shortcut written by an earlier run for this Python and project is kept, so
+    # winshell and COM are only loaded when one has to be (re)written
+    try:
+        shortcut_path, python, project, mtime = SHORTCUT_MARKER.read_text().split('\n')
+        if ((python, project) == (sys.executable, str(PROJECT_ROOT)) and
+                os.stat(shortcut_path).st_mtime_ns == int(mtime)):
+            print(f"✅ Desktop shortcut exists: {shortcut_path}")
+            return True
+    except (OSError, ValueError):
+        pass
+    
     try:
         import winshell
         from win32com.client import Dispatch
@@ -167,10 +398,12 @@ def create_desktop_shortcut():
         shell = Dispatch('WScript.Shell')
         shortcut = shell.CreateShortCut(shortcut_path)
         shortcut.Targetpath = sys.executable
-        shortcut.Arguments = str(Path(__file__).parent / "main.py")
-        shortcut.WorkingDirectory = str(Path(__file__).parent)
+        shortcut.Arguments = str(PROJECT_ROOT / "main.py")
+        shortcut.WorkingDirectory = str(PROJECT_ROOT)
         shortcut.IconLocation = sys.executable
         shortcut.save()
+        write_marker(SHORTCUT_MARKER, f"{shortcut_path}\n{sys.executable}\n{PROJECT_ROOT}\n"
+                                      f"{os.stat(shortcut_path).st_mtime_ns}")
         
         print(f"✅ Desktop shortcut created: {shortcut_path}")
         return True
@@ -187,23 +420,101 @@ def run_test_suite():
     print("\nRunning test suite...")
     
     try:
-        test_script = Path(__file__).parent / "test_gui.py"
-        result = subprocess.run([sys.executable, str(test_script)], 
-                              capture_output=True, text=True)
-        
-        print(result.stdout)
-        if result.stderr:
-            print("Errors:")
-            print(result.stderr)
-        
+        test_script = PROJECT_ROOT / "test_gui.py"
+        # The output goes straight to the terminal, so progress shows as the tests run
+        sys.stdout.flush()
+        result = subprocess.run([sys.executable, str(test_script)])
         return result.returncode == 0
         
     except Exception as e:
         print(f"❌ Test suite failed: {e}")
         return False
 
-def main():
+class CapturedOutput:
+    """sys.stdout stand-in that holds back what checks on worker threads print"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (self._stream if buffer is None else buffer).write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+    
+    def capture(self, check):
+        """Run a check, returning its result and what it printed"""
+        self._local.buffer = io.StringIO()
+        try:
+            return check(), self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+def run_checks(checks, main_thread_checks):
+    """Run independent checks, the first ones on a thread pool; results by name
+    
+    The pooled checks' output is printed after the main thread checks, in order.
+    """
+    results = {}
+    output = CapturedOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [(name, executor.submit(output.capture, check)) for name, check in checks]
+            for name, check in main_thread_checks:
+                results[name] = check()
+            for name, future in futures:
+                results[name], text = future.result()
+                print(text, end='')
+    finally:
+        sys.stdout = output._stream
+    return results
+
+def launch_gui(gui_args):
+    """Replace the installer process with the GUI"""
+    print("\nStarting the GUI...")
+    sys.stdout.flush()
+    sys.stderr.flush()
+    command = [sys.executable, str(PROJECT_ROOT / "main.py"), *gui_args]
+    if sys.platform == 'win32':
+        # Windows has no exec: os.execv starts a new process without quoting
+        # its arguments, so run the GUI as a child and exit with its status
+        sys.exit(subprocess.call(command))
+    os.execv(sys.executable, command)
+
+def parse_args(argv=None):
+    """Parse the installer's command line"""
+    parser = argparse.ArgumentParser(
+        description="Set up the Starfish Python GUI",
+        epilog="With pip 24 or later, dependencies are downloaded in parallel; "
+               "set PIP_PARALLEL_DOWNLOADS to change the number of downloads (default 5).")
+    parser.add_argument('--force', action='store_true',
+                        help="reinstall dependencies and upgrade pip even if nothing changed")
+    parser.add_argument('--and-run', nargs=argparse.REMAINDER, metavar='ARGS',
+                        help="start the GUI after a successful installation (in this process "
+                             "where the platform allows), passing it the remaining arguments")
+    parser.add_argument('--regenerate-lock', action='store_true',
+                        help="pin requirements.txt into requirements.lock with pip-tools and exit; "
+                             "dependencies are installed from the lock file when it exists")
+    parser.add_argument('--offline', action='store_true',
+                        default=os.environ.get('STARFISH_OFFLINE') == '1',
+                        help="skip pip if the installed packages satisfy requirements.txt "
+                             "(also set by STARFISH_OFFLINE=1)")
+    parser.add_argument('--deep-check', action='store_true',
+                        help="create a test Qt application, and run the VTK rendering "
+                             "test on headless machines too")
+    parser.add_argument('--verify-java', action='store_true',
+                        help="run 'java -version' instead of only looking for java on the PATH")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main installation process"""
+    args = parse_args(argv)
+    if args.regenerate_lock:
+        return 0 if regenerate_lock() else 1
+    
     print("Starfish Python GUI Installation")
     print("=" * 50)
     
@@ -211,23 +522,24 @@ def main():
     if not check_python_version():
         return 1
     
-    java_available = check_java()
-    
     # Install dependencies
-    if not install_dependencies():
+    if not install_dependencies(args.force, args.offline):
         return 1
+    precompile_project()
     
-    # Test installations
-    vtk_ok = test_vtk_installation()
-    pyqt_ok = test_pyqt_installation()
+    # The Java and jar probes are independent, so they run in the background
+    # while VTK and PyQt are tested; Qt must start on the main thread
+    results = run_checks(
+        [('java', lambda: check_java(args.verify_java)), ('jar', find_starfish_jar)],
+        [('vtk', lambda: test_vtk_installation(args.deep_check)),
+         ('pyqt', lambda: test_pyqt_installation(args.deep_check))])
+    java_available = results['java']
+    jar_found = results['jar']
     
-    if not (vtk_ok and pyqt_ok):
+    if not (results['vtk'] and results['pyqt']):
         print("\n❌ Some dependencies failed to install correctly")
         return 1
     
-    # Check for Starfish jar
-    jar_found = find_starfish_jar()
-    
     # Create shortcut
     create_desktop_shortcut()
     
@@ -257,6 +569,8 @@ def main():
             print("\n⚠️  Note: Starfish JAR not found. Download from:")
             print("   https://github.com/particleincell/Starfish/releases")
         
+        if args.and_run is not None:
+            launch_gui(args.and_run)
         return 0
     else:
         print("\n❌ Installation completed with issues.")
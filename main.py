@@ -10,20 +10,24 @@ maintaining full feature compatibility while eliminating VTK compilation issues.
 import sys
 import os
 from pathlib import Path
-from PyQt5.QtWidgets import QApplication
+from PyQt5.QtWidgets import QApplication, QSplashScreen
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QIcon, QPixmap
 
 # Add the project root to Python path
-project_root = Path(__file__).parent
+project_root = Path(__file__).resolve().parent
 sys.path.insert(0, str(project_root))
 
-from gui.main_window import StarfishMainWindow
-from core.options import Options
-
 
 def main():
     """Main entry point for Starfish GUI"""
+    # Attributes that must be set before the QApplication exists: VTK views share
+    # one OpenGL context instead of each creating and filling its own
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts, True)
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    if sys.platform == 'win32':
+        QApplication.setAttribute(Qt.AA_UseDesktopOpenGL, True)  # not ANGLE's software fallback
+    
     # Create QApplication
     app = QApplication(sys.argv)
     app.setApplicationName("Starfish")
@@ -32,8 +36,16 @@ def main():
     
     # Set application icon
     icon_path = project_root / "resources" / "starfish-100.png"
+    splash = None
     if icon_path.exists():
         app.setWindowIcon(QIcon(str(icon_path)))
+        # Shown while the GUI modules (VTK, NumPy, matplotlib) are imported
+        splash = QSplashScreen(QPixmap(str(icon_path)))
+        splash.show()
+        app.processEvents()
+    
+    from gui.main_window import StarfishMainWindow
+    from core.options import Options
     
     # Parse command line options
     options = Options(sys.argv[1:])
@@ -41,6 +53,8 @@ def main():
     # Create and show main window
     main_window = StarfishMainWindow(options)
     main_window.show()
+    if splash is not None:
+        splash.finish(main_window)
     
     # Start event loop
     sys.exit(app.exec_())